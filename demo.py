@@ -3,15 +3,16 @@ Script de demostración automatizada.
 Muestra diferentes ejemplos de optimización sin necesidad de interacción.
 """
 
+import io
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from finean import PortfolioOptimizer
-from finean.utils import calculate_returns
+from finean.data import cached_download
+from finean.utils import calculate_return_statistics
 
 
 def print_header(title):
@@ -21,8 +22,38 @@ def print_header(title):
     print(f"{'='*70}\n")
 
 
-def run_example(name, tickers, period='2y', risk_free_rate=0.04):
-    """Ejecuta un ejemplo de optimización."""
+def download_all(examples):
+    """
+    Descarga en una sola llamada los precios de cierre de todos los ejemplos.
+
+    Agrupa los tickers de todos los ejemplos por periodo para amortizar el
+    costo de red entre ejemplos. Retorna un dict {periodo: DataFrame}.
+    """
+    tickers_by_period = {}
+    for example in examples:
+        tickers_by_period.setdefault(example['period'], set()).update(example['tickers'])
+    
+    all_prices = {}
+    for period, tickers in tickers_by_period.items():
+        all_tickers = sorted(tickers)
+        print(f"⏳ Descargando {len(all_tickers)} tickers ({period})...")
+        try:
+            data = cached_download(all_tickers, period=period, interval='1d', progress=False,
+                                   auto_adjust=True, threads=True, group_by='column')
+            all_prices[period] = data['Close']
+        except Exception as e:
+            print(f"✗ Error en la descarga conjunta: {e}")
+    
+    return all_prices
+
+
+def run_example(name, tickers, period='2y', risk_free_rate=0.04, prices=None):
+    """
+    Ejecuta un ejemplo de optimización.
+    
+    Si se entregan `prices` (precios de cierre descargados previamente) y
+    contienen todos los tickers, se usan directamente; si no, se descargan.
+    """
     print_header(f"EJEMPLO: {name}")
     
     print(f"Tickers: {', '.join(tickers)}")
@@ -30,17 +61,21 @@ def run_example(name, tickers, period='2y', risk_free_rate=0.04):
     print(f"Tasa libre de riesgo: {risk_free_rate*100:.1f}%\n")
     
     try:
-        # Descargar datos
-        print("⏳ Descargando datos...")
-        data = yf.download(tickers, period=period, interval='1d', progress=False, auto_adjust=True)
-        
-        if len(tickers) == 1:
-            prices = data['Close'].to_frame()
-            prices.columns = tickers
+        if prices is not None and all(t in prices.columns for t in tickers):
+            prices = prices[tickers].dropna()
         else:
-            prices = data['Close']
-        
-        prices = prices.dropna()
+            # Descargar datos
+            print("⏳ Descargando datos...")
+            data = cached_download(tickers, period=period, interval='1d', progress=False, auto_adjust=True)
+            
+            if len(tickers) == 1:
+                # Construir el DataFrame de una vez (sin to_frame + renombrar columnas)
+                prices = pd.DataFrame(np.asarray(data['Close']).reshape(-1, 1),
+                                      index=data.index, columns=tickers)
+            else:
+                prices = data['Close']
+            
+            prices = prices.dropna()
         
         if len(prices) < 50:
             print(f"⚠️  Datos insuficientes ({len(prices)} días). Saltando este ejemplo.\n")
@@ -49,9 +84,7 @@ def run_example(name, tickers, period='2y', risk_free_rate=0.04):
         print(f"✓ Descargados {len(prices)} días de datos\n")
         
         # Calcular métricas
-        returns = calculate_returns(prices, method='simple')
-        expected_returns = returns.mean() * 252
-        covariance_matrix = returns.cov() * 252
+        expected_returns, covariance_matrix = calculate_return_statistics(prices, periods_per_year=252)
         
         # Optimizar
         optimizer = PortfolioOptimizer(
@@ -66,21 +99,24 @@ def run_example(name, tickers, period='2y', risk_free_rate=0.04):
             'long_only': True
         })
         
-        # Mostrar resultados
-        print("PORTAFOLIO ÓPTIMO:")
-        print("-" * 70)
+        # Mostrar resultados (acumulados y emitidos en una sola escritura)
+        buf = io.StringIO()
+        print("PORTAFOLIO ÓPTIMO:", file=buf)
+        print("-" * 70, file=buf)
         
         weights = result['weights'].sort_values(ascending=False)
-        for ticker, weight in weights.items():
-            if weight > 0.01:
-                bar = '█' * int(weight * 40)
-                print(f"  {ticker:10s} {weight*100:6.2f}%  {bar}")
+        weights = weights[weights > 0.01]
+        values = np.asarray(weights.values)
+        lengths = (values * 40).astype(int)
+        lines = [f"  {ticker:10s} {weight*100:6.2f}%  {'█' * length}"
+                 for ticker, weight, length in zip(weights.index, values, lengths)]
+        buf.write("\n".join(lines) + "\n")
         
-        print(f"\nMÉTRICAS:")
-        print("-" * 70)
-        print(f"  Retorno Esperado:  {result['expected_return']*100:7.2f}% anual")
-        print(f"  Volatilidad:       {result['volatility']*100:7.2f}% anual")
-        print(f"  Ratio de Sharpe:   {result['sharpe_ratio']:7.2f}")
+        print(f"\nMÉTRICAS:", file=buf)
+        print("-" * 70, file=buf)
+        print(f"  Retorno Esperado:  {result['expected_return']*100:7.2f}% anual", file=buf)
+        print(f"  Volatilidad:       {result['volatility']*100:7.2f}% anual", file=buf)
+        print(f"  Ratio de Sharpe:   {result['sharpe_ratio']:7.2f}", file=buf)
         
         # Calificar el Sharpe
         sharpe = result['sharpe_ratio']
@@ -93,8 +129,11 @@ def run_example(name, tickers, period='2y', risk_free_rate=0.04):
         else:
             rating = "⭐ Excelente"
         
-        print(f"  Calificación:      {rating}")
-        print()
+        print(f"  Calificación:      {rating}", file=buf)
+        print(file=buf)
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         
         return result
         
@@ -103,8 +142,12 @@ def run_example(name, tickers, period='2y', risk_free_rate=0.04):
         return None
 
 
-def main():
-    """Ejecuta varios ejemplos de demostración."""
+def main(auto=False):
+    """
+    Ejecuta varios ejemplos de demostración.
+    
+    Si `auto` es True no se espera confirmación del usuario entre ejemplos.
+    """
     print("\n" + "="*70)
     print("DEMOSTRACIÓN AUTOMATIZADA - OPTIMIZACIÓN DE PORTAFOLIOS".center(70))
     print("="*70)
@@ -138,20 +181,23 @@ def main():
         },
     ]
     
+    all_prices = download_all(examples)
     results = {}
     
     for example in examples:
         result = run_example(
             name=example['name'],
             tickers=example['tickers'],
-            period=example['period']
+            period=example['period'],
+            prices=all_prices.get(example['period'])
         )
         
         if result:
             results[example['name']] = result
         
         print()
-        input("Presiona Enter para continuar al siguiente ejemplo...")
+        if not auto:
+            input("Presiona Enter para continuar al siguiente ejemplo...")
     
     # Resumen final
     if results:
@@ -207,8 +253,11 @@ def main():
 
 
 if __name__ == "__main__":
+    # Modo desatendido: `python demo.py --auto` o FINEAN_AUTO=1
+    auto = '--auto' in sys.argv[1:] or bool(os.environ.get('FINEAN_AUTO'))
+    
     try:
-        main()
+        main(auto=auto)
     except KeyboardInterrupt:
         print("\n\n✗ Demostración cancelada.\n")
     except Exception as e:
@@ -14,6 +14,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render to file only; avoids GUI backend startup
 import matplotlib.pyplot as plt
 from finean import PortfolioOptimizer, TimeSeriesPredictor
 from finean.utils import calculate_returns
@@ -35,38 +37,42 @@ def generate_sample_data(n_days: int = 1000, n_assets: int = 5) -> pd.DataFrame:
     pd.DataFrame
         Sample price data
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Generate asset names
     assets = [f'Asset_{i+1}' for i in range(n_assets)]
     
     # Parameters for each asset
-    initial_prices = np.random.uniform(50, 150, n_assets)
-    annual_returns = np.random.uniform(0.05, 0.20, n_assets)
-    annual_vols = np.random.uniform(0.15, 0.35, n_assets)
+    initial_prices = rng.uniform(50, 150, n_assets)
+    annual_returns = rng.uniform(0.05, 0.20, n_assets)
+    annual_vols = rng.uniform(0.15, 0.35, n_assets)
     
     # Daily parameters
     daily_returns = annual_returns / 252
     daily_vols = annual_vols / np.sqrt(252)
     
     # Generate correlation matrix
-    corr_matrix = np.random.uniform(-0.5, 0.8, (n_assets, n_assets))
+    corr_matrix = rng.uniform(-0.5, 0.8, (n_assets, n_assets))
     corr_matrix = (corr_matrix + corr_matrix.T) / 2
     np.fill_diagonal(corr_matrix, 1.0)
     
-    # Generate returns using multivariate normal
-    returns = np.random.multivariate_normal(
-        daily_returns,
-        np.outer(daily_vols, daily_vols) * corr_matrix,
-        n_days
-    )
+    # Generate returns using multivariate normal: factor the correlation
+    # once, scale its rows by the volatilities (cov = L @ L.T) and transform
+    # standard normal draws (returns = mu + Z @ L.T)
+    try:
+        L_corr = np.linalg.cholesky(corr_matrix)
+    except np.linalg.LinAlgError:
+        # Random correlations may not be positive definite; clip eigenvalues
+        eigvals, eigvecs = np.linalg.eigh(corr_matrix)
+        L_corr = eigvecs * np.sqrt(np.clip(eigvals, 0, None))
+    L = L_corr * daily_vols[:, None]
     
-    # Convert to prices
-    prices = np.zeros((n_days, n_assets))
-    prices[0] = initial_prices
+    returns = daily_returns + rng.standard_normal((n_days, n_assets)) @ L.T
     
-    for i in range(1, n_days):
-        prices[i] = prices[i-1] * (1 + returns[i])
+    # Convert to prices with a cumulative product (first row is the initial price)
+    growth = 1 + returns
+    growth[0] = 1.0
+    prices = initial_prices * np.cumprod(growth, axis=0)
     
     # Create DataFrame
     dates = pd.date_range(start='2020-01-01', periods=n_days, freq='D')
@@ -117,7 +123,8 @@ def main():
     optimizer = PortfolioOptimizer(
         expected_returns=expected_returns,
         covariance_matrix=cov_matrix,
-        risk_free_rate=0.02  # 2% risk-free rate
+        risk_free_rate=0.02,  # 2% risk-free rate
+        chol=predictions['cholesky']  # Reuse the predictor's factorization
     )
     
     # Maximum Sharpe ratio portfolio
@@ -201,7 +208,9 @@ def main():
         
         # Save figure
         output_path = os.path.join(os.path.dirname(__file__), 'portfolio_optimization_results.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        # Use FINEAN_DPI=300 for publication-quality output
+        dpi = int(os.environ.get('FINEAN_DPI', '100'))
+        plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
         print(f"Visualization saved to: {output_path}")
         
     except Exception as e:
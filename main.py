@@ -8,16 +8,17 @@ Este script permite:
 4. Mostrar los pesos óptimos y métricas del portafolio
 """
 
+import io
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from datetime import datetime, timedelta
 from finean import PortfolioOptimizer
-from finean.utils import calculate_returns, calculate_volatility
+from finean.data import cached_download
+from finean.utils import calculate_return_statistics
 
 
 def download_stock_data(tickers: list, period: str = '2y', interval: str = '1d') -> pd.DataFrame:
@@ -45,12 +46,13 @@ def download_stock_data(tickers: list, period: str = '2y', interval: str = '1d')
     
     try:
         # Descargar datos
-        data = yf.download(tickers, period=period, interval=interval, progress=False, auto_adjust=True)
+        data = cached_download(tickers, period=period, interval=interval, progress=False, auto_adjust=True)
         
         # Si hay un solo ticker, yfinance devuelve una estructura diferente
         if len(tickers) == 1:
-            prices = data['Close'].to_frame()
-            prices.columns = tickers
+            # Construir el DataFrame de una vez (sin to_frame + renombrar columnas)
+            prices = pd.DataFrame(np.asarray(data['Close']).reshape(-1, 1),
+                                  index=data.index, columns=tickers)
         else:
             # Usar precios de cierre (auto_adjust=True ya ajusta los precios)
             prices = data['Close']
@@ -90,14 +92,12 @@ def calculate_portfolio_metrics(prices: pd.DataFrame, risk_free_rate: float = 0.
     print("Calculando métricas del portafolio...")
     print(f"{'='*70}\n")
     
-    # Calcular retornos diarios
-    returns = calculate_returns(prices, method='simple')
-    
-    # Calcular retornos esperados anualizados (promedio * 252 días de trading)
-    expected_returns = returns.mean() * 252
-    
-    # Calcular matriz de covarianza anualizada
-    covariance_matrix = returns.cov() * 252
+    # Calcular retornos diarios una sola vez y derivar de ellos los
+    # retornos esperados y la matriz de covarianza anualizados (252 días)
+    # (en float32; el resultado se entrega en float64 para el optimizador)
+    expected_returns, covariance_matrix = calculate_return_statistics(
+        prices, periods_per_year=252, dtype=np.float32
+    )
     
     # Mostrar estadísticas
     print("Retornos Esperados Anualizados:")
@@ -107,13 +107,13 @@ def calculate_portfolio_metrics(prices: pd.DataFrame, risk_free_rate: float = 0.
     
     print(f"\nVolatilidad Anualizada:")
     print("-" * 70)
-    volatilities = np.sqrt(np.diag(covariance_matrix))
+    volatilities = np.sqrt(np.einsum('ii->i', covariance_matrix.values))
     for ticker, vol in zip(expected_returns.index, volatilities):
         print(f"  {ticker:8s}: {vol*100:7.2f}%")
     
     print(f"\nMatriz de Correlación:")
     print("-" * 70)
-    correlation_matrix = returns.corr()
+    correlation_matrix = covariance_matrix / np.outer(volatilities, volatilities)
     print(correlation_matrix.round(3))
     print()
     
@@ -178,27 +178,35 @@ def print_optimization_results(result: dict):
     result : dict
         Diccionario con resultados de la optimización
     """
-    print(f"{'='*70}")
-    print("RESULTADOS DE LA OPTIMIZACIÓN")
-    print(f"{'='*70}\n")
+    # Acumular la salida y emitirla en una sola escritura
+    buf = io.StringIO()
+    
+    print(f"{'='*70}", file=buf)
+    print("RESULTADOS DE LA OPTIMIZACIÓN", file=buf)
+    print(f"{'='*70}\n", file=buf)
     
     if not result['optimization_success']:
-        print("⚠️  ADVERTENCIA: La optimización no convergió completamente\n")
+        print("⚠️  ADVERTENCIA: La optimización no convergió completamente\n", file=buf)
     
-    print("Pesos Óptimos del Portafolio:")
-    print("-" * 70)
+    print("Pesos Óptimos del Portafolio:", file=buf)
+    print("-" * 70, file=buf)
     weights = result['weights']
-    for ticker, weight in weights.items():
-        bar = '█' * int(weight * 50)
-        print(f"  {ticker:8s}: {weight*100:6.2f}% {bar}")
+    values = np.asarray(weights.values)
+    lengths = (values * 50).astype(int)
+    lines = [f"  {ticker:8s}: {weight*100:6.2f}% {'█' * length}"
+             for ticker, weight, length in zip(weights.index, values, lengths)]
+    buf.write("\n".join(lines) + "\n")
     
-    print(f"\nMétricas del Portafolio Óptimo:")
-    print("-" * 70)
-    print(f"  Retorno Esperado:  {result['expected_return']*100:7.2f}% anual")
-    print(f"  Volatilidad:       {result['volatility']*100:7.2f}% anual")
-    print(f"  Ratio de Sharpe:   {result['sharpe_ratio']:7.2f}")
+    print(f"\nMétricas del Portafolio Óptimo:", file=buf)
+    print("-" * 70, file=buf)
+    print(f"  Retorno Esperado:  {result['expected_return']*100:7.2f}% anual", file=buf)
+    print(f"  Volatilidad:       {result['volatility']*100:7.2f}% anual", file=buf)
+    print(f"  Ratio de Sharpe:   {result['sharpe_ratio']:7.2f}", file=buf)
+    
+    print(f"\n{'='*70}\n", file=buf)
     
-    print(f"\n{'='*70}\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 def main():
@@ -10,9 +10,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from finean import PortfolioOptimizer
-from finean.utils import calculate_returns
+from finean.data import DEFAULT_TTL, cached_download
+from finean.utils import calculate_return_statistics
 
 
 def get_user_input():
@@ -121,32 +121,34 @@ def get_user_input():
     }
 
 
-def download_and_validate(tickers, period):
-    """Descarga y valida los datos."""
+def download_and_validate(tickers, period, use_cache=True):
+    """
+    Descarga y valida los datos.
+    
+    Con use_cache=True se reutiliza una descarga de menos de un día guardada
+    en ~/.cache/finean; con False siempre se consulta a Yahoo Finance.
+    """
     print(f"{'='*70}")
     print("Descargando datos del mercado...")
     print(f"{'='*70}\n")
     
     try:
-        data = yf.download(tickers, period=period, interval='1d', progress=False, auto_adjust=True)
-        
-        if len(tickers) == 1:
-            prices = data['Close'].to_frame()
-            prices.columns = tickers
-        else:
-            prices = data['Close']
-        
-        prices = prices.dropna()
+        # Una sola ruta de descarga (todos los tickers en paralelo); ttl=0
+        # ignora la copia en disco y fuerza una consulta nueva
+        ttl = DEFAULT_TTL if use_cache else 0
+        data = cached_download(tickers, period=period, interval='1d', ttl=ttl,
+                               progress=False, auto_adjust=True)
         
-        # Validar que todos los tickers tengan datos
-        valid_tickers = []
-        invalid_tickers = []
+        prices = data['Close']
+        if isinstance(prices, pd.Series):
+            prices = prices.to_frame(tickers[0])
         
-        for ticker in tickers:
-            if ticker in prices.columns and len(prices[ticker].dropna()) > 50:
-                valid_tickers.append(ticker)
-            else:
-                invalid_tickers.append(ticker)
+        # Validar que todos los tickers tengan datos, contando las
+        # observaciones de todas las columnas a la vez
+        counts = prices.notna().sum(axis=0).reindex(tickers, fill_value=0)
+        valid_mask = counts.values > 50
+        valid_tickers = counts.index[valid_mask].tolist()
+        invalid_tickers = counts.index[~valid_mask].tolist()
         
         if invalid_tickers:
             print(f"⚠️  Los siguientes tickers no tienen datos suficientes: {', '.join(invalid_tickers)}")
@@ -155,7 +157,11 @@ def download_and_validate(tickers, period):
         if len(valid_tickers) < 2:
             raise ValueError("Se necesitan al menos 2 activos con datos válidos")
         
-        prices = prices[valid_tickers]
+        # Rellenar hacia adelante solo los huecos interiores de cada columna
+        # (limit_area='inside'): el último precio de un ticker que deja de
+        # cotizar no se arrastra hasta el final. dropna elimina las filas
+        # previas al inicio o posteriores al fin de la serie más corta
+        prices = prices[valid_tickers].ffill(limit_area='inside').dropna()
         
         print(f"✓ Datos descargados exitosamente")
         print(f"  - Periodo: {prices.index[0].date()} a {prices.index[-1].date()}")
@@ -169,12 +175,30 @@ def download_and_validate(tickers, period):
         raise
 
 
+def periods_per_year(index):
+    """
+    Observaciones por año del índice de precios.
+    
+    Con activos de calendarios distintos (p. ej. BTC-USD cotiza los fines de
+    semana) hay unas 365 filas por año en lugar de 252; anualizar con el
+    número real de filas evita subestimar medias y varianzas.
+    """
+    years = (index[-1] - index[0]).days / 365.25
+    return (len(index) - 1) / years if years > 0 else 252
+
+
 def optimize_and_display(prices, risk_free_rate, min_weight, max_weight, strategy):
     """Realiza la optimización y muestra resultados."""
-    # Calcular métricas
-    returns = calculate_returns(prices, method='simple')
-    expected_returns = returns.mean() * 252
-    covariance_matrix = returns.cov() * 252
+    # Calcular métricas: media y covarianza anualizadas con una sola
+    # multiplicación BLAS (Rc.T @ Rc) en lugar de la covarianza por pares de pandas.
+    # Se usan retornos logarítmicos, que se suman en el tiempo, por lo que
+    # anualizar multiplicando por los periodos por año no introduce sesgo. El
+    # optimizador espera un retorno aritmético, así que la media logarítmica
+    # se convierte con mu + sigma^2 / 2
+    expected_returns, covariance_matrix = calculate_return_statistics(
+        prices, method='log', periods_per_year=periods_per_year(prices.index)
+    )
+    expected_returns = expected_returns + 0.5 * np.diag(covariance_matrix.values)
     
     print(f"{'='*70}")
     print("Métricas Individuales de los Activos")
@@ -183,11 +207,13 @@ def optimize_and_display(prices, risk_free_rate, min_weight, max_weight, strateg
     print(f"{'Ticker':<10} {'Retorno Anual':>15} {'Volatilidad':>15} {'Sharpe':>10}")
     print("-" * 70)
     
-    for ticker in expected_returns.index:
-        ret = expected_returns[ticker] * 100
-        vol = np.sqrt(covariance_matrix.loc[ticker, ticker]) * 100
-        sharpe = (expected_returns[ticker] - risk_free_rate) / np.sqrt(covariance_matrix.loc[ticker, ticker])
-        print(f"{ticker:<10} {ret:>14.2f}% {vol:>14.2f}% {sharpe:>10.2f}")
+    # Volatilidades y Sharpe de todos los activos en una sola pasada
+    mu_arr = expected_returns.values
+    vols = np.sqrt(np.diag(covariance_matrix.values))
+    sharpes = (mu_arr - risk_free_rate) / vols
+    
+    for i, ticker in enumerate(expected_returns.index):
+        print(f"{ticker:<10} {mu_arr[i]*100:>14.2f}% {vols[i]*100:>14.2f}% {sharpes[i]:>10.2f}")
     
     print()
     
@@ -240,11 +266,15 @@ def print_result(result, title):
     print(f"Pesos del Portafolio ({title}):")
     print("-" * 70)
     
-    weights = result['weights'].sort_values(ascending=False)
-    for ticker, weight in weights.items():
-        if weight > 0.001:
-            bar = '█' * int(weight * 50)
-            print(f"  {ticker:<10} {weight*100:>6.2f}% {bar}")
+    # Ordenar y filtrar sobre arreglos de NumPy, e imprimir todo de una vez
+    values = result['weights'].values
+    order = np.argsort(-values)
+    order = order[values[order] > 0.001]
+    tickers = result['weights'].index.values[order]
+    lines = [f"  {ticker:<10} {weight*100:>6.2f}% {'█' * int(weight * 50)}"
+             for ticker, weight in zip(tickers, values[order])]
+    if lines:
+        print('\n'.join(lines))
     
     print(f"\nMétricas del Portafolio:")
     print("-" * 70)
@@ -277,14 +307,14 @@ def compare_results(result1, result2):
     print()
 
 
-def main():
+def main(use_cache=True):
     """Función principal interactiva."""
     try:
         # Obtener parámetros del usuario
         config = get_user_input()
         
         # Descargar datos
-        prices = download_and_validate(config['tickers'], config['period'])
+        prices = download_and_validate(config['tickers'], config['period'], use_cache=use_cache)
         
         # Optimizar
         results = optimize_and_display(
@@ -317,4 +347,5 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    # `python main_interactive.py --no-cache` fuerza una descarga nueva
+    exit(main(use_cache='--no-cache' not in sys.argv[1:]))
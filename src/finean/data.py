@@ -0,0 +1,106 @@
+"""
+Market data download helpers with an on-disk cache.
+
+Downloading prices from Yahoo Finance is network-bound and dominates the
+wall-clock time of the scripts. Results are cached on disk keyed by the
+request parameters so repeated runs read from a local file instead.
+"""
+
+import os
+import time
+import hashlib
+import tempfile
+import pandas as pd
+import yfinance as yf
+from typing import List, Optional
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'finean')
+DEFAULT_TTL = 24 * 60 * 60  # One day, in seconds
+
+# yf.download options that affect how data is fetched, not what is returned
+_TRANSPORT_OPTIONS = ('threads', 'progress', 'timeout', 'session')
+
+
+def _cache_key(tickers: List[str], period: str, interval: str, **kwargs) -> str:
+    """Build a stable hash for a download request."""
+    options = sorted((k, v) for k, v in kwargs.items() if k not in _TRANSPORT_OPTIONS)
+    params = (sorted(tickers), period, interval, options)
+    return hashlib.sha1(repr(params).encode('utf-8')).hexdigest()
+
+
+def cached_download(tickers: List[str], period: str = '2y', interval: str = '1d',
+                    ttl: float = DEFAULT_TTL, cache_dir: Optional[str] = None,
+                    **kwargs) -> pd.DataFrame:
+    """
+    Download market data with yfinance, reusing a fresh on-disk copy if present.
+
+    Set the FINEAN_NO_CACHE environment variable to bypass the cache.
+
+    Parameters:
+    -----------
+    tickers : list
+        Ticker symbols to download
+    period : str, default='2y'
+        Data period ('1y', '2y', '5y', etc.)
+    interval : str, default='1d'
+        Data interval ('1d', '1wk', '1mo')
+    ttl : float, default=86400
+        Maximum age of a cached file in seconds
+    cache_dir : str, optional
+        Cache directory (default: ~/.cache/finean)
+    **kwargs : dict
+        Additional arguments forwarded to yf.download (threads=True by
+        default). Transport options such as `threads`, `progress`,
+        `timeout` and `session` are not part of the cache key.
+
+    Returns:
+    --------
+    pd.DataFrame
+        Raw yfinance download result
+    """
+    # Fetch tickers concurrently; yfinance reuses its own pooled session
+    # across calls, so no per-call session needs to be created here
+    kwargs.setdefault('threads', True)
+
+    if os.environ.get('FINEAN_NO_CACHE'):
+        return yf.download(tickers, period=period, interval=interval, **kwargs)
+
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    key = _cache_key(tickers, period, interval, **kwargs)
+    path = os.path.join(cache_dir, f"{key}.pkl")
+
+    if os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
+        try:
+            return pd.read_pickle(path)
+        except Exception:
+            # Truncated or unreadable (e.g. written by another pandas
+            # version): download again and overwrite it
+            pass
+
+    data = yf.download(tickers, period=period, interval=interval, **kwargs)
+
+    # Only cache non-empty results so failed downloads are retried
+    if not data.empty:
+        _write_cache(data, cache_dir, path)
+
+    return data
+
+
+def _write_cache(data: pd.DataFrame, cache_dir: str, path: str):
+    """
+    Pickle data to path atomically.
+
+    The frame is written to a temporary file in the cache directory and moved
+    into place with os.replace, so an interrupted run never leaves a partial
+    file behind under the final name.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            data.to_pickle(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,592 @@
+"""
+Shared data pipeline for the portfolio scripts.
+
+Downloads prices, computes portfolio statistics, runs the selected
+optimization strategies and reports them, so each script is only a few
+lines of configuration around `run`.
+
+Price downloads and the derived portfolio statistics are memoized in-process,
+keyed on the (tickers, period, interval) request, so running several scripts
+in the same session (e.g. from a notebook) downloads and computes them once.
+Cached objects are shared between callers and must not be mutated.
+"""
+
+import os
+import sys
+import json
+import functools
+import traceback
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .data import cached_download
+from .portfolio_optimizer import PortfolioOptimizer
+from .utils import calculate_return_statistics
+
+
+# Optimization strategies: optimizer method and report texts
+STRATEGIES = {
+    'max_sharpe': {
+        'method': 'optimize_max_sharpe',
+        'label': 'Max Sharpe',
+        'emoji': '⭐',
+        'goal': 'Maximizar Ratio de Sharpe',
+        'message': 'Optimizando para mejor retorno ajustado por riesgo...',
+        'title': 'PORTAFOLIO ÓPTIMO: MÁXIMO SHARPE RATIO',
+        'note': 'Máximo Sharpe: Mejor eficiencia (retorno/riesgo)'
+    },
+    'min_vol': {
+        'method': 'optimize_min_volatility',
+        'label': 'Min Vol',
+        'emoji': '🛡️',
+        'goal': 'Minimizar Volatilidad',
+        'message': 'Optimizando para mínimo riesgo...',
+        'title': 'PORTAFOLIO ÓPTIMO: MÍNIMA VOLATILIDAD',
+        'note': 'Mínima Volatilidad: Menor riesgo posible'
+    },
+    'max_return': {
+        'method': 'optimize_max_return',
+        'label': 'Max Return',
+        'emoji': '🚀',
+        'goal': 'Maximizar Retorno (sin considerar riesgo)',
+        'message': 'Optimizando para máximo retorno esperado...',
+        'title': 'PORTAFOLIO ÓPTIMO: MÁXIMO RETORNO',
+        'note': 'Máximo Retorno: Mayor retorno esperado (ignora el riesgo)'
+    }
+}
+
+# Order used when strategies are shown side by side (least to most risky)
+_DISPLAY_ORDER = ('min_vol', 'max_sharpe', 'max_return')
+
+# Precomputed weight bars (0% to 100% in 2% steps)
+BARS = ['█' * i for i in range(51)]
+
+# Risk profiles by annual volatility (%): <5, <10, <20, <30, rest
+RISK_THRESHOLDS = np.array([5, 10, 20, 30])
+RISK_LABELS = np.array(['Muy Bajo', 'Bajo', 'Moderado', 'Alto', 'Muy Alto'])
+
+
+@functools.lru_cache(maxsize=8)
+def _fetch(tickers: Tuple[str, ...], period: str, interval: str) -> pd.DataFrame:
+    """Download closing prices for a hashable tuple of tickers."""
+    # Concurrent download; with group_by='ticker' columns are (ticker, field)
+    data = cached_download(list(tickers), period=period, interval=interval, progress=False,
+                           auto_adjust=True, threads=True, group_by='ticker')
+
+    if isinstance(data.columns, pd.MultiIndex):
+        prices = data.xs('Close', axis=1, level=1)
+    elif len(tickers) == 1:
+        # Build the frame in one step instead of renaming a to_frame() copy
+        prices = pd.DataFrame(np.asarray(data['Close']).reshape(-1, 1),
+                              index=data.index, columns=list(tickers))
+    else:
+        prices = data['Close']
+
+    return prices.dropna()
+
+
+@functools.lru_cache(maxsize=8)
+def _metrics(tickers: Tuple[str, ...], period: str, interval: str,
+             periods_per_year: int, dtype: type) -> Tuple[pd.Series, pd.DataFrame, Optional[np.ndarray]]:
+    """Compute annualized statistics and the Cholesky factor for a cached download."""
+    prices = _fetch(tickers, period, interval)
+    expected_returns, covariance_matrix = calculate_return_statistics(
+        prices, periods_per_year=periods_per_year, dtype=dtype
+    )
+
+    try:
+        chol = np.linalg.cholesky(covariance_matrix.values)
+    except np.linalg.LinAlgError:
+        # Not positive definite: the optimizer falls back to the quadratic form
+        chol = None
+
+    return expected_returns, covariance_matrix, chol
+
+
+def fetch_prices(tickers: List[str], period: str = '2y', interval: str = '1d') -> pd.DataFrame:
+    """
+    Download closing prices, reusing an earlier result for the same request.
+
+    Parameters:
+    -----------
+    tickers : list
+        Ticker symbols to download
+    period : str, default='2y'
+        Data period ('1y', '2y', '5y', etc.)
+    interval : str, default='1d'
+        Data interval ('1d', '1wk', '1mo')
+
+    Returns:
+    --------
+    pd.DataFrame
+        Closing prices with one column per ticker and incomplete rows dropped
+    """
+    return _fetch(tuple(tickers), period, interval)
+
+
+def portfolio_metrics(tickers: List[str], period: str = '2y', interval: str = '1d',
+                      periods_per_year: int = 252,
+                      dtype: type = np.float64) -> Tuple[pd.Series, pd.DataFrame, Optional[np.ndarray]]:
+    """
+    Compute expected returns, covariance and its Cholesky factor for a download.
+
+    Parameters:
+    -----------
+    tickers : list
+        Ticker symbols to download
+    period : str, default='2y'
+        Data period ('1y', '2y', '5y', etc.)
+    interval : str, default='1d'
+        Data interval ('1d', '1wk', '1mo')
+    periods_per_year : int, default=252
+        Number of periods per year for annualization
+    dtype : type, default=np.float64
+        Working precision for returns and covariance; results are float64
+
+    Returns:
+    --------
+    tuple
+        (expected_returns, covariance_matrix, chol) where chol is the lower
+        Cholesky factor of the covariance, or None if it is not positive definite
+    """
+    return _metrics(tuple(tickers), period, interval, periods_per_year, dtype)
+
+
+def rolling_covariance(returns, window: int) -> np.ndarray:
+    """
+    Compute the sample covariance matrix over every sliding window of returns.
+
+    All windows are contracted in a single `np.einsum` call with
+    `optimize=True`, which dispatches the batched product to BLAS instead of
+    looping over windows in Python.
+
+    Parameters:
+    -----------
+    returns : pd.DataFrame or np.ndarray
+        Returns with shape (n_periods, n_assets)
+    window : int
+        Number of observations per window (at least 2)
+
+    Returns:
+    --------
+    np.ndarray
+        Array of shape (n_periods - window + 1, n_assets, n_assets) where
+        entry w is the covariance of observations w to w + window - 1
+    """
+    R = np.asarray(returns, dtype=np.float64)
+    if window < 2 or window > R.shape[0]:
+        raise ValueError(f"window must be between 2 and {R.shape[0]}, got {window}")
+
+    # Views of shape (n_windows, n_assets, window); centering makes the copy
+    windows = np.lib.stride_tricks.sliding_window_view(R, window, axis=0)
+    Rc = windows - windows.mean(axis=2, keepdims=True)
+
+    return np.einsum('wit,wjt->wij', Rc, Rc, optimize=True) / (window - 1)
+
+
+def download_stock_data(tickers: List[str], period: str = '2y', interval: str = '1d') -> pd.DataFrame:
+    """Download closing prices with `fetch_prices` and report the date range."""
+    print(f"\n{'='*70}")
+    print(f"Descargando datos históricos para: {', '.join(tickers)}")
+    print(f"Periodo: {period}, Intervalo: {interval}")
+    print(f"{'='*70}\n")
+
+    try:
+        # Reuse the download if it was already made in this session
+        prices = fetch_prices(tickers, period=period, interval=interval)
+
+        print(f"✓ Datos descargados exitosamente")
+        print(f"  - Periodo: {prices.index[0].date()} a {prices.index[-1].date()}")
+        print(f"  - Días de trading: {len(prices)}")
+        print(f"  - Activos: {len(tickers)}\n")
+
+        return prices
+
+    except Exception as e:
+        print(f"✗ Error al descargar datos: {e}")
+        raise
+
+
+def calculate_portfolio_metrics(tickers: List[str], period: str = '2y', interval: str = '1d',
+                                verbose: bool = True) -> Tuple[pd.Series, pd.DataFrame, Optional[np.ndarray]]:
+    """
+    Compute portfolio statistics with `portfolio_metrics` and print them.
+
+    Statistics are computed in float32 working precision and returned as
+    float64, as SLSQP requires. With verbose=False nothing is printed, which
+    avoids formatting the correlation matrix in parameter sweeps.
+
+    Returns:
+    --------
+    tuple
+        (expected_returns, covariance_matrix, chol)
+    """
+    if verbose:
+        print(f"{'='*70}")
+        print("Calculando métricas del portafolio...")
+        print(f"{'='*70}\n")
+
+    expected_returns, covariance_matrix, chol = portfolio_metrics(
+        tickers, period=period, interval=interval, periods_per_year=252, dtype=np.float32
+    )
+
+    if verbose:
+        cov = covariance_matrix.values
+        volatilities = np.sqrt(np.einsum('ii->i', cov))
+
+        print("Retornos Esperados Anualizados:")
+        print("-" * 70)
+        for ticker, ret in expected_returns.items():
+            print(f"  {ticker:8s}: {ret*100:7.2f}%")
+
+        print(f"\nVolatilidad Anualizada:")
+        print("-" * 70)
+        for ticker, vol in zip(expected_returns.index, volatilities):
+            print(f"  {ticker:8s}: {vol*100:7.2f}%")
+
+        print(f"\nMatriz de Correlación:")
+        print("-" * 70)
+        # Scale the covariance already computed: corr = D @ cov @ D, D = diag(1/sigma)
+        inv_vol = 1.0 / volatilities
+        correlation = cov * inv_vol[:, None] * inv_vol[None, :]
+        # One %-template per row and a single write, rather than the pandas
+        # repr; each row starts with its ticker like the header columns
+        labels = [str(t)[:8] for t in covariance_matrix.columns]
+        row_fmt = ' '.join(['%7.3f'] * len(labels))
+        lines = [' ' * 8 + ' ' + ' '.join(f"{label[:7]:>7s}" for label in labels)]
+        lines.extend(f"{label:8s} " + row_fmt % tuple(row)
+                     for label, row in zip(labels, correlation))
+        sys.stdout.write('\n'.join(lines) + '\n\n')
+
+    return expected_returns, covariance_matrix, chol
+
+
+def print_portfolio_results(title: str, result: dict):
+    """
+    Print an optimization result in a readable form.
+
+    When stdout is not a terminal and the FINEAN_JSON environment variable
+    is set, a single JSON line is emitted instead.
+    """
+    if os.environ.get('FINEAN_JSON') and not sys.stdout.isatty():
+        weights = result['weights']
+        print(json.dumps({
+            'title': title,
+            'optimization_success': bool(result['optimization_success']),
+            'expected_return': float(result['expected_return']),
+            'volatility': float(result['volatility']),
+            'sharpe_ratio': float(result['sharpe_ratio']),
+            'weights': dict(zip(weights.index.tolist(), weights.values.tolist()))
+        }))
+        return
+
+    print(f"{'='*70}")
+    print(f"{title}")
+    print(f"{'='*70}\n")
+
+    if not result['optimization_success']:
+        print("⚠️  ADVERTENCIA: La optimización no convergió completamente\n")
+
+    print("Pesos del Portafolio:")
+    print("-" * 70)
+    weights = result['weights']
+    values = weights.values
+
+    # Sort by descending weight
+    order = np.argsort(-values)
+
+    for ticker, weight in zip(weights.index.values[order], values[order]):
+        if weight > 0.001:  # Only show significant weights
+            bar = BARS[min(int(weight * 50), 50)]
+            print(f"  {ticker:8s}: {weight*100:6.2f}% {bar}")
+
+    print(f"\nMétricas del Portafolio:")
+    print("-" * 70)
+    print(f"  Retorno Esperado:  {result['expected_return']*100:7.2f}% anual")
+    print(f"  Volatilidad:       {result['volatility']*100:7.2f}% anual")
+    print(f"  Ratio de Sharpe:   {result['sharpe_ratio']:7.2f}")
+    print()
+
+
+def compare_strategies(results: Dict[str, dict]):
+    """
+    Compare optimization results side by side and print recommendations.
+
+    Parameters:
+    -----------
+    results : dict
+        Optimization results keyed by strategy name (see `STRATEGIES`)
+    """
+    print(f"{'='*70}")
+    print("COMPARACIÓN DE ESTRATEGIAS (ordenado por retorno)")
+    print(f"{'='*70}\n")
+
+    keys = [key for key in _DISPLAY_ORDER if key in results]
+    ret = {key: results[key]['expected_return'] * 100 for key in keys}
+    vol = {key: results[key]['volatility'] * 100 for key in keys}
+    sharpe = {key: results[key]['sharpe_ratio'] for key in keys}
+
+    # Sort by return (lowest to highest)
+    rows = sorted(keys, key=lambda key: ret[key])
+
+    # Visual risk indicator: classify all volatilities at once
+    vols = np.array([vol[key] for key in rows])
+    profiles = RISK_LABELS[np.searchsorted(RISK_THRESHOLDS, vols, side='right')]
+
+    print(f"{'Estrategia':<18} {'Retorno':>12} {'Volatilidad':>12} {'Sharpe':>10} {'Perfil':>12}")
+    print("-" * 70)
+
+    for key, profile in zip(rows, profiles):
+        name = f"{STRATEGIES[key]['label']} {STRATEGIES[key]['emoji']}"
+        print(f"{name:<18} {ret[key]:>11.2f}% {vol[key]:>11.2f}% {sharpe[key]:>10.2f}   {profile}")
+
+    print(f"\n{'='*70}\n")
+
+    # Recommendations
+    print("RECOMENDACIONES:")
+    print("-" * 70)
+
+    best_sharpe = max(sharpe.values())
+
+    def others(values: dict, key: str) -> list:
+        return [value for other, value in values.items() if other != key]
+
+    if 'max_sharpe' in results and sharpe['max_sharpe'] >= best_sharpe * 0.95:
+        print("✓ MÁXIMO SHARPE: Mejor balance entre retorno y riesgo")
+        print("  Recomendado para inversores que buscan eficiencia")
+
+    if 'min_vol' in results and (
+            sharpe['min_vol'] >= best_sharpe * 0.95
+            or vol['min_vol'] < min(others(vol, 'min_vol'), default=np.inf) * 0.85):
+        print("✓ MÍNIMA VOLATILIDAD: Menor riesgo")
+        print("  Recomendado para inversores conservadores")
+
+    if 'max_return' in results and ret['max_return'] > max(others(ret, 'max_return'), default=np.inf) * 1.1:
+        print("⚠️  MÁXIMO RETORNO: Mayor retorno pero con MÁS RIESGO")
+        if 'max_sharpe' in results:
+            print(f"  Volatilidad: {vol['max_return']:.2f}% (vs {vol['max_sharpe']:.2f}% Max Sharpe)")
+        else:
+            print(f"  Volatilidad: {vol['max_return']:.2f}%")
+        print("  Solo para inversores agresivos con alta tolerancia al riesgo")
+
+    print(f"\n{'='*70}\n")
+
+
+def plot_portfolio_scenarios(results: Dict[str, dict], investment_amount: float = 10000,
+                             time_horizon: int = 1, filename: str = 'portfolio_scenarios.png'):
+    """
+    Plot pessimistic, expected and optimistic scenarios for each portfolio.
+
+    Parameters:
+    -----------
+    results : dict
+        Optimization results keyed by strategy name (see `STRATEGIES`)
+    investment_amount : float, default=10000
+        Initial investment
+    time_horizon : int, default=1
+        Time horizon in years
+    filename : str, default='portfolio_scenarios.png'
+        Output image path; the resolution is read from FINEAN_DPI (default 150)
+    """
+    # Deferred import: matplotlib is only loaded when plotting, and without a
+    # terminal the Agg backend avoids pulling in Tk/Qt
+    import matplotlib
+    if not sys.stdout.isatty():
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    print(f"{'='*70}")
+    print("PROYECCIÓN DE ESCENARIOS")
+    print(f"{'='*70}\n")
+    print(f"Inversión inicial: ${investment_amount:,.0f}")
+    print(f"Horizonte temporal: {time_horizon} año(s)\n")
+
+    keys = [key for key in _DISPLAY_ORDER if key in results]
+    names = [f"{STRATEGIES[key]['label']} {STRATEGIES[key]['emoji']}" for key in keys]
+
+    # Scenarios are computed once for both the plot and the table
+    # Pessimistic: expected return - 2 standard deviations
+    # Expected: expected return
+    # Optimistic: expected return + 2 standard deviations
+    mu = np.array([results[key]['expected_return'] for key in keys])
+    sig = np.array([results[key]['volatility'] for key in keys])
+
+    pessimistic = investment_amount * (1 + (mu - 2 * sig) * time_horizon)
+    expected = investment_amount * (1 + mu * time_horizon)
+    optimistic = investment_amount * (1 + (mu + 2 * sig) * time_horizon)
+
+    # Keep the pessimistic scenario from going negative
+    pessimistic = np.maximum(pessimistic, investment_amount * 0.1)
+
+    fig, axes = plt.subplots(1, len(keys), figsize=(5 * len(keys), 5), squeeze=False)
+    fig.suptitle('Proyección de Portafolios: Escenarios a 1 Año', fontsize=16, fontweight='bold')
+
+    for idx, name in enumerate(names):
+        ax = axes[0, idx]
+
+        scenarios = ['Pesimista\n(-2σ)', 'Esperado', 'Optimista\n(+2σ)']
+        values = [pessimistic[idx], expected[idx], optimistic[idx]]
+        colors = ['#d62728', '#2ca02c', '#1f77b4']
+
+        bars = ax.bar(scenarios, values, color=colors, alpha=0.7, edgecolor='black', linewidth=1.5)
+
+        # Reference line (initial investment)
+        ax.axhline(y=investment_amount, color='gray', linestyle='--', linewidth=2, label='Inversión inicial')
+
+        # Bar labels (a single artist for all bars)
+        labels = [f'${value:,.0f}\n({(value - investment_amount) / investment_amount * 100:+.1f}%)'
+                  for value in values]
+        ax.bar_label(bars, labels=labels, fontsize=9, fontweight='bold')
+
+        ax.set_title(f'{name}\nRetorno: {mu[idx]*100:.1f}% | Vol: {sig[idx]*100:.1f}%',
+                     fontsize=11, fontweight='bold')
+        ax.set_ylabel('Valor del Portafolio ($)', fontsize=10)
+        ax.set_ylim(0, max(values) * 1.2)
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+        ax.legend(fontsize=8)
+
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+
+    plt.tight_layout()
+
+    # 150 dpi is enough on screen: PNG encoding cost grows with the square of
+    # the resolution (use FINEAN_DPI=300 for print quality)
+    dpi = int(os.environ.get('FINEAN_DPI', '150'))
+    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    print(f"✓ Gráfico guardado como: {filename}\n")
+
+    plt.show()
+
+    # Scenario summary table
+    print("TABLA DE ESCENARIOS:")
+    print("-" * 70)
+    print(f"{'Portafolio':<20} {'Pesimista':>15} {'Esperado':>15} {'Optimista':>15}")
+    print("-" * 70)
+
+    for idx, name in enumerate(names):
+        print(f"{name:<20} ${pessimistic[idx]:>14,.0f} ${expected[idx]:>14,.0f} ${optimistic[idx]:>14,.0f}")
+
+    print()
+    print("INTERPRETACIÓN:")
+    print("-" * 70)
+    print("• Pesimista: Escenario donde el retorno es 2 desviaciones estándar BAJO el esperado")
+    print("             (probabilidad ~2.5% de ser peor que esto)")
+    print("• Esperado: Retorno promedio esperado basado en datos históricos")
+    print("• Optimista: Escenario donde el retorno es 2 desviaciones estándar SOBRE el esperado")
+    print("             (probabilidad ~2.5% de ser mejor que esto)")
+    print(f"\n{'='*70}\n")
+
+
+def _optimize_strategies(optimizer: PortfolioOptimizer, strategies: Sequence[str],
+                         constraints: Dict, n_jobs: int = 1) -> Dict[str, dict]:
+    """Solve the selected strategies, in worker processes when n_jobs != 1."""
+    if n_jobs == 1 or len(strategies) < 2:
+        return {key: getattr(optimizer, STRATEGIES[key]['method'])(constraints=constraints)
+                for key in strategies}
+
+    if n_jobs is None or n_jobs < 1:
+        n_jobs = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(strategies))) as executor:
+        futures = {key: executor.submit(getattr(optimizer, STRATEGIES[key]['method']),
+                                        constraints=constraints)
+                   for key in strategies}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def run(tickers: List[str], strategies: Sequence[str] = ('max_sharpe', 'min_vol', 'max_return'),
+        period: str = '2y', interval: str = '1d', risk_free_rate: float = 0.04,
+        min_weight: float = 0.0, max_weight: float = 0.40, plot: bool = True,
+        investment_amount: float = 10000, time_horizon: int = 1, n_jobs: int = 1) -> int:
+    """
+    Download prices, optimize the selected strategies and report the results.
+
+    Parameters:
+    -----------
+    tickers : list
+        Ticker symbols to include in the portfolio
+    strategies : sequence of str, default=('max_sharpe', 'min_vol', 'max_return')
+        Strategies to run, in order (keys of `STRATEGIES`)
+    period : str, default='2y'
+        Data period ('1y', '2y', '5y', etc.)
+    interval : str, default='1d'
+        Data interval ('1d', '1wk', '1mo')
+    risk_free_rate : float, default=0.04
+        Annual risk-free rate
+    min_weight : float, default=0.0
+        Minimum weight per asset
+    max_weight : float, default=0.40
+        Maximum weight per asset
+    plot : bool, default=True
+        Whether to plot the scenario projections
+    investment_amount : float, default=10000
+        Initial investment for the scenario projections
+    time_horizon : int, default=1
+        Time horizon in years for the scenario projections
+    n_jobs : int, default=1
+        Worker processes for the strategy optimizations, which are
+        independent (1 solves them in this process, -1 uses all CPUs)
+
+    Returns:
+    --------
+    int
+        Process exit code: 0 on success, 1 on error
+    """
+    unknown = [key for key in strategies if key not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown strategies: {unknown}. Choose from {list(STRATEGIES)}")
+
+    try:
+        download_stock_data(tickers, period=period, interval=interval)
+
+        expected_returns, covariance_matrix, chol = calculate_portfolio_metrics(
+            tickers, period=period, interval=interval
+        )
+
+        optimizer = PortfolioOptimizer(
+            expected_returns=expected_returns,
+            covariance_matrix=covariance_matrix,
+            risk_free_rate=risk_free_rate,
+            chol=chol
+        )
+
+        constraints = {
+            'min_weight': min_weight,
+            'max_weight': max_weight,
+            'long_only': True
+        }
+
+        results = _optimize_strategies(optimizer, strategies, constraints, n_jobs)
+
+        for number, key in enumerate(strategies, start=1):
+            strategy = STRATEGIES[key]
+            print(f"{'='*70}")
+            print(f"ESTRATEGIA {number}: {strategy['goal']}")
+            print(f"{'='*70}\n")
+            print(f"{strategy['message']}\n")
+
+            print_portfolio_results(strategy['title'], results[key])
+
+        compare_strategies(results)
+
+        if plot:
+            plot_portfolio_scenarios(results, investment_amount=investment_amount,
+                                     time_horizon=time_horizon)
+
+        print("NOTAS:")
+        print("-" * 70)
+        for key in strategies:
+            print(f"• {STRATEGIES[key]['note']}")
+        print("• Los retornos son anualizados basados en datos históricos")
+        print("• La optimización está sujeta a las restricciones de peso configuradas")
+        print(f"  (mín: {min_weight*100:.0f}%, máx: {max_weight*100:.0f}% por activo)")
+        print(f"\n{'='*70}\n")
+
+    except Exception as e:
+        print(f"\n✗ Error durante la ejecución: {e}")
+        traceback.print_exc()
+        return 1
+
+    return 0
@@ -10,9 +10,16 @@ Implements various portfolio optimization strategies including:
 
 import numpy as np
 import pandas as pd
-from typing import Optional, Dict, List, Tuple
-from scipy.optimize import minimize
+from typing import Optional, Dict, List, Tuple, Union
+from scipy.optimize import Bounds, minimize
+from scipy.linalg import cho_solve
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Squared volatility floor for the branchless Sharpe ratio division
+_VOL_EPS2 = 1e-24
 
 
 class PortfolioOptimizer:
@@ -24,31 +31,78 @@ class PortfolioOptimizer:
     covariance from time series analysis.
     """
     
-    def __init__(self, expected_returns: pd.Series, 
-                 covariance_matrix: pd.DataFrame,
-                 risk_free_rate: float = 0.0):
+    def __init__(self, expected_returns: Union[pd.Series, np.ndarray],
+                 covariance_matrix: Union[pd.DataFrame, np.ndarray],
+                 risk_free_rate: float = 0.0,
+                 chol: Optional[np.ndarray] = None):
         """
         Initialize the portfolio optimizer.
         
         Parameters:
         -----------
-        expected_returns : pd.Series
+        expected_returns : pd.Series or np.ndarray
             Expected returns for each asset (annualized)
-        covariance_matrix : pd.DataFrame
-            Covariance matrix of asset returns (annualized)
+        covariance_matrix : pd.DataFrame or np.ndarray
+            Covariance matrix of asset returns (annualized). Plain arrays
+            are used as-is; asset labels are then taken from
+            expected_returns, or default to 0..n-1.
         risk_free_rate : float, default=0.0
             Risk-free rate (annualized)
+        chol : np.ndarray, optional
+            Precomputed lower Cholesky factor of the covariance matrix.
+            If None, it is computed here.
         """
-        self.expected_returns = expected_returns
-        self.cov_matrix = covariance_matrix
+        # Work on the raw arrays; labels are only needed for the returned weights
+        if isinstance(covariance_matrix, pd.DataFrame):
+            cov = covariance_matrix.to_numpy(dtype=np.float64)
+            index = covariance_matrix.index
+        else:
+            cov = np.asarray(covariance_matrix, dtype=np.float64)
+            index = (expected_returns.index if isinstance(expected_returns, pd.Series)
+                     else pd.RangeIndex(len(cov)))
+        self._index = index
+        self._mu_np = np.asarray(expected_returns, dtype=np.float64)
+        self.expected_returns = (expected_returns if isinstance(expected_returns, pd.Series)
+                                 else pd.Series(self._mu_np, index=index))
         self.risk_free_rate = risk_free_rate
-        self.assets = expected_returns.index.tolist()
+        self.assets = index.tolist()
         self.n_assets = len(self.assets)
         
-        # Validate inputs
-        if not np.allclose(self.cov_matrix, self.cov_matrix.T):
-            warnings.warn("Covariance matrix is not symmetric. Symmetrizing it.")
-            self.cov_matrix = (self.cov_matrix + self.cov_matrix.T) / 2
+        # Symmetrize unconditionally: cheaper than comparing against the
+        # transpose, and exact for an already symmetric matrix. The objectives
+        # work on these contiguous arrays, never on the pandas objects.
+        self._cov_np = np.ascontiguousarray(0.5 * (cov + cov.T))
+        self.cov_matrix = pd.DataFrame(self._cov_np, index=index, columns=index, copy=False)
+        
+        # Cholesky factor of the covariance, computed on first use by _L and
+        # then shared by every optimization run on this instance
+        self._chol = None if chol is None else np.asarray(chol, dtype=np.float64)
+        self._factored = chol is not None
+        
+        # Efficient frontier coefficients, filled in on first use
+        self._frontier_params = None
+    
+    @property
+    def _L(self) -> Optional[np.ndarray]:
+        """
+        Lower Cholesky factor of the covariance (cov = L @ L.T).
+        
+        Factored once on first access, so every volatility evaluation is a
+        single triangular mat-vec: vol = ||L.T @ w||. None if the covariance
+        is not positive definite, in which case the quadratic form is used.
+        """
+        if not self._factored:
+            try:
+                self._chol = np.linalg.cholesky(self._cov_np)
+            except np.linalg.LinAlgError:
+                self._chol = None
+            self._factored = True
+        return self._chol
+    
+    @_L.setter
+    def _L(self, value: Optional[np.ndarray]):
+        self._chol = value
+        self._factored = True
     
     def optimize_max_sharpe(self, constraints: Optional[Dict] = None) -> Dict:
         """
@@ -74,35 +128,34 @@ class PortfolioOptimizer:
             - 'volatility': Portfolio volatility
             - 'sharpe_ratio': Portfolio Sharpe ratio
         """
-        # Set default constraints
-        if constraints is None:
-            constraints = {}
-        
-        max_weight = constraints.get('max_weight', 1.0)
-        min_weight = constraints.get('min_weight', 0.0)
-        long_only = constraints.get('long_only', True)
-        
         # Initial guess: equal weights
-        x0 = np.array([1.0 / self.n_assets] * self.n_assets)
+        x0 = np.full(self.n_assets, 1.0 / self.n_assets)
+        bounds, constraint = self._default_bounds_and_constraints(constraints)
         
-        # Bounds for weights
-        if long_only:
-            bounds = tuple((min_weight, max_weight) for _ in range(self.n_assets))
-        else:
-            bounds = tuple((-max_weight, max_weight) for _ in range(self.n_assets))
+        # Tangency portfolio w ∝ cov^-1 (mu - rf) is optimal if no bound binds
+        closed_form = self._closed_form_weights(self._mu_np - self.risk_free_rate)
+        if closed_form is not None:
+            if self._within_bounds(closed_form, bounds):
+                return self._result_from_weights(closed_form, True)
+            # Otherwise warm-start SLSQP from its projection onto the bounds
+            x0 = self._project_to_bounds(closed_form, bounds, x0)
         
-        # Constraints: weights sum to 1
-        constraint = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1.0}
+        # Objective: negative Sharpe ratio (to minimize); the closure binds
+        # the ndarrays directly so each evaluation skips attribute lookups
+        mu, cov, L, rf = self._mu_np, self._cov_np, self._L, self.risk_free_rate
         
-        # Objective: negative Sharpe ratio (to minimize)
         def neg_sharpe(weights):
-            return -self._calculate_sharpe_ratio(weights)
+            return -_sharpe(weights, mu, cov, L, rf)
+        
+        def neg_sharpe_grad(weights):
+            return -self._sharpe_ratio_gradient(weights)
         
         # Optimize
         result = minimize(
             neg_sharpe,
             x0,
             method='SLSQP',
+            jac=neg_sharpe_grad,
             bounds=bounds,
             constraints=constraint,
             options={'maxiter': 1000, 'ftol': 1e-9}
@@ -111,19 +164,7 @@ class PortfolioOptimizer:
         if not result.success:
             warnings.warn(f"Optimization did not converge: {result.message}")
         
-        # Extract results
-        optimal_weights = pd.Series(result.x, index=self.assets)
-        portfolio_return = self._calculate_portfolio_return(result.x)
-        portfolio_vol = self._calculate_portfolio_volatility(result.x)
-        sharpe = self._calculate_sharpe_ratio(result.x)
-        
-        return {
-            'weights': optimal_weights,
-            'expected_return': portfolio_return,
-            'volatility': portfolio_vol,
-            'sharpe_ratio': sharpe,
-            'optimization_success': result.success
-        }
+        return self._result_from_weights(result.x, result.success)
     
     def optimize_min_volatility(self, constraints: Optional[Dict] = None) -> Dict:
         """
@@ -141,35 +182,30 @@ class PortfolioOptimizer:
         dict
             Optimization results
         """
-        # Set default constraints
-        if constraints is None:
-            constraints = {}
-        
-        max_weight = constraints.get('max_weight', 1.0)
-        min_weight = constraints.get('min_weight', 0.0)
-        long_only = constraints.get('long_only', True)
-        
         # Initial guess: equal weights
-        x0 = np.array([1.0 / self.n_assets] * self.n_assets)
+        x0 = np.full(self.n_assets, 1.0 / self.n_assets)
+        bounds, constraint = self._default_bounds_and_constraints(constraints)
         
-        # Bounds for weights
-        if long_only:
-            bounds = tuple((min_weight, max_weight) for _ in range(self.n_assets))
-        else:
-            bounds = tuple((-max_weight, max_weight) for _ in range(self.n_assets))
-        
-        # Constraints: weights sum to 1
-        constraint = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1.0}
+        # Minimum variance portfolio w ∝ cov^-1 1 is optimal if no bound binds
+        closed_form = self._closed_form_weights(np.ones(self.n_assets))
+        if closed_form is not None:
+            if self._within_bounds(closed_form, bounds):
+                return self._result_from_weights(closed_form, True)
+            # Otherwise warm-start SLSQP from its projection onto the bounds
+            x0 = self._project_to_bounds(closed_form, bounds, x0)
         
         # Objective: portfolio volatility
+        cov, L = self._cov_np, self._L
+        
         def portfolio_vol(weights):
-            return self._calculate_portfolio_volatility(weights)
+            return _port_vol(weights, cov, L)
         
         # Optimize
         result = minimize(
             portfolio_vol,
             x0,
             method='SLSQP',
+            jac=self._portfolio_volatility_gradient,
             bounds=bounds,
             constraints=constraint,
             options={'maxiter': 1000, 'ftol': 1e-9}
@@ -178,19 +214,7 @@ class PortfolioOptimizer:
         if not result.success:
             warnings.warn(f"Optimization did not converge: {result.message}")
         
-        # Extract results
-        optimal_weights = pd.Series(result.x, index=self.assets)
-        portfolio_return = self._calculate_portfolio_return(result.x)
-        portfolio_vol = self._calculate_portfolio_volatility(result.x)
-        sharpe = self._calculate_sharpe_ratio(result.x)
-        
-        return {
-            'weights': optimal_weights,
-            'expected_return': portfolio_return,
-            'volatility': portfolio_vol,
-            'sharpe_ratio': sharpe,
-            'optimization_success': result.success
-        }
+        return self._result_from_weights(result.x, result.success)
     
     def optimize_max_return(self, constraints: Optional[Dict] = None) -> Dict:
         """
@@ -210,35 +234,22 @@ class PortfolioOptimizer:
         dict
             Optimization results
         """
-        # Set default constraints
-        if constraints is None:
-            constraints = {}
-        
-        max_weight = constraints.get('max_weight', 1.0)
-        min_weight = constraints.get('min_weight', 0.0)
-        long_only = constraints.get('long_only', True)
-        
         # Initial guess: equal weights
-        x0 = np.array([1.0 / self.n_assets] * self.n_assets)
-        
-        # Bounds for weights
-        if long_only:
-            bounds = tuple((min_weight, max_weight) for _ in range(self.n_assets))
-        else:
-            bounds = tuple((-max_weight, max_weight) for _ in range(self.n_assets))
+        x0 = np.full(self.n_assets, 1.0 / self.n_assets)
+        bounds, constraint = self._default_bounds_and_constraints(constraints)
         
-        # Constraints: weights sum to 1
-        constraint = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1.0}
+        # Objective: negative return (to minimize), with constant gradient -mu
+        neg_mu = -self._mu_np
         
-        # Objective: negative return (to minimize)
         def neg_return(weights):
-            return -self._calculate_portfolio_return(weights)
+            return neg_mu @ weights
         
         # Optimize
         result = minimize(
             neg_return,
             x0,
             method='SLSQP',
+            jac=lambda weights: neg_mu,
             bounds=bounds,
             constraints=constraint,
             options={'maxiter': 1000, 'ftol': 1e-9}
@@ -247,22 +258,11 @@ class PortfolioOptimizer:
         if not result.success:
             warnings.warn(f"Optimization did not converge: {result.message}")
         
-        # Extract results
-        optimal_weights = pd.Series(result.x, index=self.assets)
-        portfolio_return = self._calculate_portfolio_return(result.x)
-        portfolio_vol = self._calculate_portfolio_volatility(result.x)
-        sharpe = self._calculate_sharpe_ratio(result.x)
-        
-        return {
-            'weights': optimal_weights,
-            'expected_return': portfolio_return,
-            'volatility': portfolio_vol,
-            'sharpe_ratio': sharpe,
-            'optimization_success': result.success
-        }
+        return self._result_from_weights(result.x, result.success)
     
     def optimize_max_return_for_risk(self, target_volatility: float,
-                                     constraints: Optional[Dict] = None) -> Dict:
+                                     constraints: Optional[Dict] = None,
+                                     x0: Optional[np.ndarray] = None) -> Dict:
         """
         Optimize portfolio for maximum return given a target volatility.
         
@@ -275,44 +275,52 @@ class PortfolioOptimizer:
             Target portfolio volatility (standard deviation)
         constraints : dict, optional
             Additional constraints (same as optimize_max_sharpe)
+        x0 : np.ndarray, optional
+            Initial guess for the iterative solver, e.g. the weights of a
+            nearby frontier point (default: equal weights)
             
         Returns:
         --------
         dict
             Optimization results
         """
-        # Set default constraints
-        if constraints is None:
-            constraints = {}
-        
-        max_weight = constraints.get('max_weight', 1.0)
-        min_weight = constraints.get('min_weight', 0.0)
-        long_only = constraints.get('long_only', True)
-        
-        # Initial guess: equal weights
-        x0 = np.array([1.0 / self.n_assets] * self.n_assets)
-        
-        # Bounds for weights
-        if long_only:
-            bounds = tuple((min_weight, max_weight) for _ in range(self.n_assets))
-        else:
-            bounds = tuple((-max_weight, max_weight) for _ in range(self.n_assets))
+        warm_start = x0 is not None
+        if not warm_start:
+            # Initial guess: equal weights
+            x0 = np.full(self.n_assets, 1.0 / self.n_assets)
+        bounds, constraint = self._default_bounds_and_constraints(constraints)
+        
+        # The upper branch of the sum-to-1 frontier is optimal if no bound binds
+        closed_form = self._closed_form_frontier_weights(np.array([target_volatility]))
+        if closed_form is not None and not np.isnan(closed_form[0]).any():
+            closed_form = closed_form[0]
+            if self._within_bounds(closed_form, bounds):
+                return self._result_from_weights(closed_form, True)
+            # Otherwise start SLSQP from its projection onto the bounds,
+            # unless the caller supplied a (closer) initial guess
+            if not warm_start:
+                x0 = self._project_to_bounds(closed_form, bounds, x0)
         
         # Constraints: weights sum to 1, volatility <= target
+        cov, L = self._cov_np, self._L
         constraints_list = [
-            {'type': 'eq', 'fun': lambda x: np.sum(x) - 1.0},
-            {'type': 'ineq', 'fun': lambda x: target_volatility - self._calculate_portfolio_volatility(x)}
+            constraint,
+            {'type': 'ineq', 'fun': lambda x: target_volatility - _port_vol(x, cov, L),
+             'jac': lambda x: -self._portfolio_volatility_gradient(x)}
         ]
         
-        # Objective: negative return (to minimize)
+        # Objective: negative return (to minimize), with constant gradient -mu
+        neg_mu = -self._mu_np
+        
         def neg_return(weights):
-            return -self._calculate_portfolio_return(weights)
+            return neg_mu @ weights
         
         # Optimize
         result = minimize(
             neg_return,
             x0,
             method='SLSQP',
+            jac=lambda weights: neg_mu,
             bounds=bounds,
             constraints=constraints_list,
             options={'maxiter': 1000, 'ftol': 1e-9}
@@ -321,22 +329,12 @@ class PortfolioOptimizer:
         if not result.success:
             warnings.warn(f"Optimization did not converge: {result.message}")
         
-        # Extract results
-        optimal_weights = pd.Series(result.x, index=self.assets)
-        portfolio_return = self._calculate_portfolio_return(result.x)
-        portfolio_vol = self._calculate_portfolio_volatility(result.x)
-        sharpe = self._calculate_sharpe_ratio(result.x)
-        
-        return {
-            'weights': optimal_weights,
-            'expected_return': portfolio_return,
-            'volatility': portfolio_vol,
-            'sharpe_ratio': sharpe,
-            'optimization_success': result.success
-        }
+        return self._result_from_weights(result.x, result.success)
     
     def calculate_efficient_frontier(self, n_points: int = 100,
-                                     constraints: Optional[Dict] = None) -> pd.DataFrame:
+                                     constraints: Optional[Dict] = None,
+                                     parallel: bool = False,
+                                     n_jobs: int = -1) -> pd.DataFrame:
         """
         Calculate the efficient frontier.
         
@@ -349,12 +347,96 @@ class PortfolioOptimizer:
             Number of points to calculate on the efficient frontier
         constraints : dict, optional
             Additional constraints (same as optimize_max_sharpe)
+        parallel : bool, default=False
+            Solve the points in worker processes (see
+            calculate_efficient_frontier_parallel). Worth it only when many
+            points need an iterative solve; process startup dominates otherwise.
+        n_jobs : int, default=-1
+            Number of worker processes when parallel=True (-1 uses all CPUs)
+            
+        Returns:
+        --------
+        pd.DataFrame
+            DataFrame with columns: volatility, expected_return, sharpe_ratio
+        """
+        if parallel:
+            return self.calculate_efficient_frontier_parallel(n_points, constraints, n_jobs)
+        
+        target_vols = self._frontier_target_volatilities(n_points, constraints)
+        
+        # Solve every point where no bound binds in one batched pass, then
+        # optimize the remaining target volatilities one by one
+        points = self._closed_form_frontier_points(target_vols, constraints)
+        
+        # Target volatilities are increasing, so each iterative solve is
+        # warm-started from the previous one, whose optimum is close by
+        results = []
+        prev_weights = None
+        for target_vol, point in zip(target_vols, points):
+            if point is None:
+                try:
+                    result = self.optimize_max_return_for_risk(target_vol, constraints, x0=prev_weights)
+                except Exception:
+                    continue
+                prev_weights = result['weights'].values
+                point = _frontier_point(result)
+            results.append(point)
+        
+        return pd.DataFrame(results)
+    
+    def calculate_efficient_frontier_parallel(self, n_points: int = 100,
+                                              constraints: Optional[Dict] = None,
+                                              n_jobs: int = -1) -> pd.DataFrame:
+        """
+        Calculate the efficient frontier solving the points in parallel.
+        
+        Each target volatility is an independent optimization, so the points
+        are distributed across worker processes.
+        
+        Parameters:
+        -----------
+        n_points : int, default=100
+            Number of points to calculate on the efficient frontier
+        constraints : dict, optional
+            Additional constraints (same as optimize_max_sharpe)
+        n_jobs : int, default=-1
+            Number of worker processes (-1 uses all available CPUs)
             
         Returns:
         --------
         pd.DataFrame
             DataFrame with columns: volatility, expected_return, sharpe_ratio
         """
+        target_vols = self._frontier_target_volatilities(n_points, constraints)
+        
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = os.cpu_count() or 1
+        
+        # Points where no bound binds are solved here in one batched pass
+        # (which also caches the frontier coefficients sent to the workers)
+        points = self._closed_form_frontier_points(target_vols, constraints)
+        pending = [i for i, point in enumerate(points) if point is None]
+        
+        if pending:
+            # Ship the optimizer (covariance, Cholesky factor) and constraints
+            # to each worker once, then send only target volatilities in chunks
+            n_jobs = min(n_jobs, len(pending))
+            chunksize = max(1, len(pending) // (4 * n_jobs))
+            with ProcessPoolExecutor(max_workers=n_jobs,
+                                     initializer=_init_frontier_worker,
+                                     initargs=(self, constraints)) as executor:
+                solved = executor.map(_solve_frontier_point, target_vols[pending],
+                                      chunksize=chunksize)
+                for i, point in zip(pending, solved):
+                    points[i] = point
+        
+        results = [point for point in points if point is not None]
+        
+        return pd.DataFrame(results)
+    
+    def _frontier_target_volatilities(self, n_points: int,
+                                      constraints: Optional[Dict] = None) -> np.ndarray:
+        """Target volatilities spanning min volatility to twice the max-Sharpe volatility."""
         # Find min and max volatility portfolios
         min_vol_result = self.optimize_min_volatility(constraints)
         max_sharpe_result = self.optimize_max_sharpe(constraints)
@@ -362,43 +444,212 @@ class PortfolioOptimizer:
         min_vol = min_vol_result['volatility']
         max_vol = max_sharpe_result['volatility'] * 2  # Extend beyond max Sharpe
         
-        # Generate target volatilities
-        target_vols = np.linspace(min_vol, max_vol, n_points)
+        return np.linspace(min_vol, max_vol, n_points)
+    
+    def _closed_form_weights(self, rhs: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Solve cov @ x = rhs with the cached Cholesky factor and normalize x to sum to 1.
         
-        # Calculate optimal portfolios for each target volatility
-        results = []
-        for target_vol in target_vols:
-            try:
-                result = self.optimize_max_return_for_risk(target_vol, constraints)
-                results.append({
-                    'volatility': result['volatility'],
-                    'expected_return': result['expected_return'],
-                    'sharpe_ratio': result['sharpe_ratio']
-                })
-            except:
-                # Skip if optimization fails for this point
-                continue
+        This is the exact optimum when only the sum-to-1 constraint is active.
+        Returns None if the factor is unavailable or the normalization is
+        not positive.
+        """
+        if self._L is None:
+            return None
         
-        return pd.DataFrame(results)
+        x = cho_solve((self._L, True), rhs)
+        total = x.sum()
+        if total <= 0:
+            return None
+        
+        return x / total
+    
+    def _frontier_parameters(self) -> Optional[Tuple]:
+        """
+        Coefficients of the sum-to-1 efficient frontier, computed once per optimizer.
+        
+        With a = cov^-1 1 and b = cov^-1 mu, every frontier portfolio is a
+        combination of a and b, and its variance is (A r^2 - 2 B r + C) / D
+        for target return r, where A = 1'a, B = 1'b, C = mu'b, D = AC - B^2.
+        Returns None if the Cholesky factor is unavailable or the frontier is
+        degenerate (e.g. all expected returns equal).
+        """
+        if self._frontier_params is None and self._L is not None:
+            a = cho_solve((self._L, True), np.ones(self.n_assets))
+            b = cho_solve((self._L, True), self._mu_np)
+            A, B, C = a.sum(), b.sum(), self._mu_np @ b
+            D = A * C - B * B
+            if A > 0 and D > 0:
+                self._frontier_params = (a, b, A, B, C, D)
+        
+        return self._frontier_params
+    
+    def _closed_form_frontier_weights(self, target_volatilities: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Maximum-return weights at each target volatility when only sum-to-1 binds.
+        
+        All targets are solved at once as an (n_targets, n_assets) array.
+        Rows for targets below the minimum attainable volatility are NaN.
+        Returns None if the frontier is unavailable.
+        """
+        params = self._frontier_parameters()
+        if params is None:
+            return None
+        
+        a, b, A, B, C, D = params
+        discriminant = D * (A * np.asarray(target_volatilities, dtype=np.float64) ** 2 - 1)
+        
+        # Upper branch: highest return with variance equal to target^2
+        with np.errstate(invalid='ignore'):
+            target_returns = (B + np.sqrt(discriminant)) / A
+        
+        coef_a = (C - B * target_returns) / D
+        coef_b = (A * target_returns - B) / D
+        return coef_a[:, None] * a + coef_b[:, None] * b
+    
+    def _closed_form_frontier_points(self, target_vols: np.ndarray,
+                                     constraints: Optional[Dict] = None) -> List[Optional[Dict]]:
+        """
+        Frontier points available in closed form, in a single batched pass.
+        
+        Entries are None for targets where a bound binds (or the closed form
+        does not apply); those still need an iterative solve.
+        """
+        points = [None] * len(target_vols)
+        weights = self._closed_form_frontier_weights(target_vols)
+        if weights is None:
+            return points
+        
+        bounds, _ = self._default_bounds_and_constraints(constraints)
+        
+        # NaN rows compare False and are left to the iterative solver
+        feasible = np.all((weights >= bounds.lb - 1e-12) & (weights <= bounds.ub + 1e-12), axis=1)
+        
+        returns = weights @ self._mu_np
+        # All quadratic forms at once: ||W @ L|| row-wise with the cached
+        # Cholesky factor, else w' cov w per row
+        if self._L is not None:
+            vols = np.linalg.norm(weights @ self._L, axis=1)
+        else:
+            vols = np.sqrt(np.einsum('ij,jk,ik->i', weights, self._cov_np, weights))
+        sharpes = _excess_over_vol(returns - self.risk_free_rate, vols)
+        
+        for i in np.flatnonzero(feasible):
+            points[i] = {
+                'volatility': vols[i],
+                'expected_return': returns[i],
+                'sharpe_ratio': sharpes[i]
+            }
+        
+        return points
+    
+    def _default_bounds_and_constraints(self, constraints: Optional[Dict] = None) -> Tuple[Bounds, Dict]:
+        """
+        Per-asset weight bounds and the sum-to-1 constraint shared by all optimizations.
+        
+        Parameters:
+        -----------
+        constraints : dict, optional
+            Constraints as accepted by optimize_max_sharpe
+            
+        Returns:
+        --------
+        tuple
+            (bounds, constraint) where bounds is a vector scipy Bounds and
+            constraint is the sum-to-1 equality with its Jacobian
+        """
+        if constraints is None:
+            constraints = {}
+        
+        max_weight = constraints.get('max_weight', 1.0)
+        min_weight = constraints.get('min_weight', 0.0)
+        long_only = constraints.get('long_only', True)
+        
+        lower = min_weight if long_only else -max_weight
+        bounds = Bounds(np.full(self.n_assets, lower), np.full(self.n_assets, max_weight))
+        
+        # Constraint: weights sum to 1
+        constraint = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1.0,
+                      'jac': lambda x: np.ones_like(x)}
+        
+        return bounds, constraint
+    
+    @staticmethod
+    def _within_bounds(weights: np.ndarray, bounds: Bounds) -> bool:
+        """Check whether weights satisfy the per-asset bounds."""
+        return bool(np.all(weights >= bounds.lb - 1e-12) and np.all(weights <= bounds.ub + 1e-12))
+    
+    @staticmethod
+    def _project_to_bounds(weights: np.ndarray, bounds: Bounds,
+                           fallback: np.ndarray) -> np.ndarray:
+        """Clip weights to the bounds and renormalize, for use as an initial guess."""
+        clipped = np.clip(weights, bounds.lb, bounds.ub)
+        total = clipped.sum()
+        
+        if total <= 0:
+            return fallback
+        
+        return clipped / total
+    
+    def _result_from_weights(self, weights: np.ndarray, success: bool) -> Dict:
+        """Build the optimization result dictionary for the given weights."""
+        portfolio_return, portfolio_vol, sharpe = self._stats(weights)
+        
+        return {
+            'weights': pd.Series(weights, index=self._index),
+            'expected_return': portfolio_return,
+            'volatility': portfolio_vol,
+            'sharpe_ratio': sharpe,
+            'optimization_success': success
+        }
+    
+    def _stats(self, weights: np.ndarray) -> Tuple[float, float, float]:
+        """Portfolio return, volatility and Sharpe ratio from a single volatility evaluation."""
+        portfolio_return = _port_ret(weights, self._mu_np)
+        portfolio_vol = _port_vol(weights, self._cov_np, self._L)
+        sharpe = _excess_over_vol(portfolio_return - self.risk_free_rate, portfolio_vol)
+        
+        return portfolio_return, portfolio_vol, sharpe
     
     def _calculate_portfolio_return(self, weights: np.ndarray) -> float:
         """Calculate expected portfolio return."""
-        return np.dot(weights, self.expected_returns)
+        return _port_ret(weights, self._mu_np)
     
     def _calculate_portfolio_volatility(self, weights: np.ndarray) -> float:
         """Calculate portfolio volatility (standard deviation)."""
-        variance = np.dot(weights, np.dot(self.cov_matrix, weights))
-        return np.sqrt(variance)
+        return _port_vol(weights, self._cov_np, self._L)
     
     def _calculate_sharpe_ratio(self, weights: np.ndarray) -> float:
         """Calculate portfolio Sharpe ratio."""
-        portfolio_return = self._calculate_portfolio_return(weights)
-        portfolio_vol = self._calculate_portfolio_volatility(weights)
+        return _sharpe(weights, self._mu_np, self._cov_np, self._L, self.risk_free_rate)
+    
+    def _volatility_and_gradient(self, weights: np.ndarray) -> Tuple[float, np.ndarray]:
+        """Portfolio volatility and its gradient cov @ w / vol, sharing one mat-vec."""
+        if self._L is not None:
+            # cov @ w = L @ (L.T @ w), reusing the product behind the norm
+            z = self._L.T @ weights
+            portfolio_vol = np.linalg.norm(z)
+            cov_w = self._L @ z
+        else:
+            cov_w = self._cov_np @ weights
+            portfolio_vol = np.sqrt(weights @ cov_w)
         
         if portfolio_vol == 0:
-            return 0.0
+            return 0.0, np.zeros_like(weights)
+        
+        return portfolio_vol, cov_w / portfolio_vol
+    
+    def _portfolio_volatility_gradient(self, weights: np.ndarray) -> np.ndarray:
+        """Gradient of portfolio volatility: cov @ w / vol."""
+        return self._volatility_and_gradient(weights)[1]
+    
+    def _sharpe_ratio_gradient(self, weights: np.ndarray) -> np.ndarray:
+        """Gradient of the Sharpe ratio: (mu - S * d(vol)/dw) / vol."""
+        portfolio_vol, vol_grad = self._volatility_and_gradient(weights)
         
-        return (portfolio_return - self.risk_free_rate) / portfolio_vol
+        # Zero for a riskless portfolio, where vol_grad is zero as well
+        sharpe = _excess_over_vol(self._mu_np @ weights - self.risk_free_rate, portfolio_vol)
+        return _excess_over_vol(self._mu_np - sharpe * vol_grad, portfolio_vol)
     
     def get_portfolio_statistics(self, weights: pd.Series) -> Dict:
         """
@@ -414,10 +665,82 @@ class PortfolioOptimizer:
         dict
             Portfolio statistics
         """
-        weights_array = weights.values
+        portfolio_return, portfolio_vol, sharpe = self._stats(weights.values)
         
         return {
-            'expected_return': self._calculate_portfolio_return(weights_array),
-            'volatility': self._calculate_portfolio_volatility(weights_array),
-            'sharpe_ratio': self._calculate_sharpe_ratio(weights_array)
+            'expected_return': portfolio_return,
+            'volatility': portfolio_vol,
+            'sharpe_ratio': sharpe
         }
+
+
+# Objective kernels on plain ndarrays. The methods above delegate here so
+# the inner SLSQP loop never touches pandas objects.
+
+def _port_ret(weights: np.ndarray, mu: np.ndarray) -> float:
+    """Expected portfolio return mu @ w."""
+    return mu @ weights
+
+
+def _port_vol(weights: np.ndarray, cov: np.ndarray, L: Optional[np.ndarray]) -> float:
+    """Portfolio volatility, as ||L.T @ w|| when the Cholesky factor L is available."""
+    if L is not None:
+        return np.linalg.norm(L.T @ weights)
+    
+    return np.sqrt(weights @ cov @ weights)
+
+
+def _sharpe(weights: np.ndarray, mu: np.ndarray, cov: np.ndarray,
+            L: Optional[np.ndarray], rf: float) -> float:
+    """Portfolio Sharpe ratio (mu @ w - rf) / vol, or 0 for a riskless portfolio."""
+    return _excess_over_vol(mu @ weights - rf, _port_vol(weights, cov, L))
+
+
+def _excess_over_vol(excess: Union[float, np.ndarray],
+                     vol: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Branchless excess / vol that is 0 when vol is 0.
+    
+    excess * vol / (vol**2 + eps) differs from excess / vol by a relative
+    eps / vol**2: about 1e-16 (machine precision) for volatilities above
+    ~1e-4, growing to 1e-4 at vol = 1e-10. Works elementwise on arrays, so
+    the scalar Sharpe ratio, its gradient and the batched frontier all share
+    the same division.
+    """
+    return excess * vol / (vol * vol + _VOL_EPS2)
+
+
+# Per-process state of frontier workers, set once by _init_frontier_worker
+_worker_optimizer = None
+_worker_constraints = None
+
+
+def _init_frontier_worker(optimizer: PortfolioOptimizer, constraints: Optional[Dict]):
+    """Store the shared optimizer and constraints in a frontier worker process."""
+    global _worker_optimizer, _worker_constraints
+    _worker_optimizer = optimizer
+    _worker_constraints = constraints
+
+
+def _solve_frontier_point(target_vol: float) -> Optional[Dict]:
+    """
+    Solve a single efficient frontier point in a worker process.
+    
+    Defined at module level so it can be dispatched to worker processes.
+    Returns None if the optimization fails for this point.
+    """
+    try:
+        result = _worker_optimizer.optimize_max_return_for_risk(target_vol, _worker_constraints)
+    except Exception:
+        return None
+    
+    return _frontier_point(result)
+
+
+def _frontier_point(result: Dict) -> Dict:
+    """Keep the frontier columns of an optimization result."""
+    return {
+        'volatility': result['volatility'],
+        'expected_return': result['expected_return'],
+        'sharpe_ratio': result['sharpe_ratio']
+    }
@@ -5,11 +5,15 @@ Supports multiple forecasting methods including ARIMA, exponential smoothing,
 and simple moving average predictions.
 """
 
+import functools
 import numpy as np
 import pandas as pd
-from typing import Optional, Tuple, Dict, List
+from scipy.signal import lfilter
+from typing import Any, Optional, Tuple, Dict, List, Union
 import warnings
 
+from .utils import centered_covariance
+
 
 class TimeSeriesPredictor:
     """
@@ -19,7 +23,7 @@ class TimeSeriesPredictor:
     based on historical data, which can be used in portfolio optimization.
     """
     
-    def __init__(self, method: str = 'ewma'):
+    def __init__(self, method: str = 'ewma', dtype: type = np.float64):
         """
         Initialize the time series predictor.
         
@@ -31,8 +35,12 @@ class TimeSeriesPredictor:
             - 'sma': Simple Moving Average
             - 'ema': Exponential Moving Average
             - 'historical_mean': Historical mean returns
+        dtype : type, default=np.float64
+            Working precision of the fitted returns. np.float32 halves
+            memory traffic; predictions are always float64.
         """
         self.method = method
+        self.dtype = dtype
         self.fitted_params = {}
         
     def fit(self, returns: pd.DataFrame, **kwargs) -> 'TimeSeriesPredictor':
@@ -42,7 +50,8 @@ class TimeSeriesPredictor:
         Parameters:
         -----------
         returns : pd.DataFrame
-            Historical returns data with assets as columns
+            Historical returns data with assets as columns. Missing values
+            switch the predictions to pandas' NaN-aware estimators
         **kwargs : dict
             Additional parameters for the specific method
             
@@ -51,17 +60,119 @@ class TimeSeriesPredictor:
         self : TimeSeriesPredictor
             Fitted predictor instance
         """
+        # The frame as passed to fit(); update() does not append to it, the
+        # predictions read the cached array below
         self.returns = returns
         self.assets = returns.columns.tolist()
         
+        # Convert once; every prediction works on this array and only wraps
+        # its result in pandas objects labelled by _idx. Column-major, so the
+        # per-asset reductions walk contiguous memory
+        self._A = np.asfortranarray(returns.to_numpy(dtype=self.dtype))
+        self._idx = returns.columns
+        self._has_nan = bool(np.isnan(self._A).any())
+        self._sample_cov_np = None
+        self._sample_chol = None
+        self._factored = False
+        
+        # Rows added by update() and running EWMA states, keyed by alpha
+        self._pending = []
+        self._ewma_state = {}
+        
         # Store method-specific parameters
         if self.method == 'ewma':
             self.span = kwargs.get('span', 60)
         elif self.method in ['sma', 'ema']:
             self.window = kwargs.get('window', 30)
         
+        # update() keeps a running state only for the method's own EWMA; the
+        # covariance is tracked too when it shares that alpha (the 'ewma' span)
+        self._online_alpha = {
+            'ewma': 2.0 / (getattr(self, 'span', 60) + 1),
+            'ema': 2.0 / (getattr(self, 'window', 30) + 1),
+        }.get(self.method)
+        
+        # Resolve the prediction kernel once instead of on every call
+        self._predict_fn = {
+            'ewma': self._predict_ewma,
+            'sma': self._predict_sma,
+            'ema': self._predict_ema,
+            'historical_mean': self._predict_historical_mean,
+        }.get(self.method)
+        
+        return self
+    
+    def update(self, new_returns: Union[pd.Series, np.ndarray]) -> 'TimeSeriesPredictor':
+        """
+        Add one period of returns without refitting.
+        
+        The EWMA mean behind the 'ewma' and 'ema' return predictions is
+        updated in O(k); with the 'ewma' method the 'ewma' covariance is
+        updated too, in O(k^2). The other estimators fold the new rows into the fitted
+        data the next time they are used. The `returns` attribute keeps the
+        originally fitted frame only.
+        
+        Parameters:
+        -----------
+        new_returns : pd.Series or np.ndarray
+            Returns of every asset for the new period. A Series is aligned
+            on the fitted assets.
+            
+        Returns:
+        --------
+        self : TimeSeriesPredictor
+            Updated predictor instance
+        """
+        if isinstance(new_returns, pd.Series):
+            new_returns = new_returns.reindex(self._idx)
+        # Copy: the row is kept in _pending, and callers may reuse their buffer
+        row = np.array(new_returns, dtype=np.float64).reshape(-1)
+        if len(row) != len(self._idx):
+            raise ValueError(f"Expected {len(self._idx)} returns, got {len(row)}")
+        
+        # The running states assume complete rows; with gaps every estimator
+        # is recomputed by pandas from the accumulated data instead
+        if self._has_nan or np.isnan(row).any():
+            self._has_nan = True
+            self._ewma_state = {}
+            self._pending.append(row)
+            return self
+        
+        # Start the running state from the data seen so far, on first use
+        alpha = self._online_alpha
+        if alpha is not None and alpha not in self._ewma_state:
+            with_cov = self.method == 'ewma'
+            self._ewma_state[alpha] = _ewma_init(self._data(), alpha, with_cov)
+        
+        for alpha, state in self._ewma_state.items():
+            _ewma_step(state, row, alpha)
+        
+        self._pending.append(row)
         return self
     
+    def _data(self) -> np.ndarray:
+        """Fitted returns, including any rows added by update()."""
+        if self._pending:
+            new_rows = np.asarray(self._pending, dtype=self._A.dtype)
+            self._A = np.asfortranarray(np.concatenate([self._A, new_rows]))
+            self._pending = []
+            self._sample_cov_np = None
+            self._factored = False
+        return self._A
+    
+    def _frame(self) -> pd.DataFrame:
+        """Fitted returns as a DataFrame, for the NaN-aware pandas fallbacks."""
+        return pd.DataFrame(self._data(), columns=self._idx)
+    
+    def _ewma_mean(self, alpha: float) -> np.ndarray:
+        """Last EWMA value, from the running state if update() keeps one."""
+        state = self._ewma_state.get(alpha)
+        if state is not None:
+            return state['mean'].copy()
+        if self._has_nan:
+            return self._frame().ewm(alpha=alpha, adjust=False).mean().iloc[-1].to_numpy(copy=True)
+        return _ewma_last(self._data(), alpha)
+    
     def predict_returns(self, horizon: int = 1) -> pd.Series:
         """
         Predict expected returns for each asset.
@@ -76,35 +187,41 @@ class TimeSeriesPredictor:
         pd.Series
             Predicted returns for each asset
         """
-        if self.method == 'ewma':
-            return self._predict_ewma()
-        elif self.method == 'sma':
-            return self._predict_sma()
-        elif self.method == 'ema':
-            return self._predict_ema()
-        elif self.method == 'historical_mean':
-            return self._predict_historical_mean()
-        else:
+        # The kernels return fresh arrays, so the result can own them
+        return pd.Series(self._predict_returns_array(), index=self._idx, copy=False)
+    
+    def _predict_returns_array(self) -> np.ndarray:
+        """Predicted returns as a freshly allocated float64 array."""
+        if self._predict_fn is None:
             raise ValueError(f"Unknown method: {self.method}")
+        return self._predict_fn().astype(np.float64, copy=False)
     
-    def _predict_ewma(self) -> pd.Series:
+    def _predict_ewma(self) -> np.ndarray:
         """Predict using Exponentially Weighted Moving Average."""
-        predicted = self.returns.ewm(span=self.span, adjust=False).mean().iloc[-1]
-        return predicted
+        return self._ewma_mean(2.0 / (self.span + 1))
     
-    def _predict_sma(self) -> pd.Series:
+    def _predict_sma(self) -> np.ndarray:
         """Predict using Simple Moving Average."""
-        predicted = self.returns.rolling(window=self.window).mean().iloc[-1]
+        if self._has_nan:
+            return self._frame().rolling(window=self.window).mean().iloc[-1].to_numpy(copy=True)
+        
+        # Only the last window is needed, not the full rolling mean
+        values = self._data()
+        if len(values) < self.window:
+            predicted = np.full(values.shape[1], np.nan)
+        else:
+            predicted = values[-self.window:].mean(axis=0)
         return predicted
     
-    def _predict_ema(self) -> pd.Series:
+    def _predict_ema(self) -> np.ndarray:
         """Predict using Exponential Moving Average."""
-        predicted = self.returns.ewm(span=self.window, adjust=False).mean().iloc[-1]
-        return predicted
+        return self._ewma_mean(2.0 / (self.window + 1))
     
-    def _predict_historical_mean(self) -> pd.Series:
+    def _predict_historical_mean(self) -> np.ndarray:
         """Predict using historical mean returns."""
-        return self.returns.mean()
+        if self._has_nan:
+            return self._frame().mean().to_numpy(copy=True)
+        return self._data().mean(axis=0)
     
     def predict_covariance(self, method: str = 'sample') -> pd.DataFrame:
         """
@@ -123,43 +240,113 @@ class TimeSeriesPredictor:
         pd.DataFrame
             Predicted covariance matrix
         """
+        return pd.DataFrame(self._covariance_array(method), index=self._idx, columns=self._idx,
+                            copy=False)
+    
+    def _covariance_array(self, method: str) -> np.ndarray:
+        """Predicted covariance as a freshly allocated k x k float64 array."""
         if method == 'sample':
-            return self.returns.cov()
+            # Copy, so callers never write into the memoized matrix
+            cov = np.array(self._sample_cov(), dtype=np.float64)
         elif method == 'ewma':
-            span = getattr(self, 'span', 60)
-            return self.returns.ewm(span=span, adjust=False).cov().iloc[-len(self.assets):]
+            alpha = 2.0 / (getattr(self, 'span', 60) + 1)
+            state = self._ewma_state.get(alpha)
+            if state is not None and state['cov'] is not None:
+                cov = _bias_corrected(state['cov'], state['sum_sq'])
+            elif self._has_nan:
+                k = len(self._idx)
+                cov = self._frame().ewm(alpha=alpha, adjust=False).cov().iloc[-k:].to_numpy(copy=True)
+            else:
+                cov = _ewma_cov_last(self._data(), alpha)
         elif method == 'shrinkage':
-            return self._ledoit_wolf_shrinkage()
+            cov = self._ledoit_wolf_shrinkage()
         else:
             raise ValueError(f"Unknown covariance method: {method}")
+        return cov.astype(np.float64, copy=False)
     
-    def _ledoit_wolf_shrinkage(self) -> pd.DataFrame:
+    def _ledoit_wolf_shrinkage(self) -> np.ndarray:
         """
         Estimate covariance matrix using Ledoit-Wolf shrinkage.
         
-        This is a simplified implementation that shrinks towards
-        the identity matrix scaled by average variance.
+        Shrinks the sample covariance towards the identity scaled by the
+        average variance, with the analytic optimal intensity of Ledoit and
+        Wolf (2004). The intensity is stored in fitted_params['shrinkage'].
         """
-        sample_cov = self.returns.cov()
+        sample_cov = self._sample_cov()
+        values = self._data()
+        if self._has_nan:
+            # The estimation error needs whole observations: use complete rows
+            values = values[~np.isnan(values).any(axis=1)]
+        n, k = values.shape
         
-        # Target matrix: identity scaled by average variance
-        avg_var = np.trace(sample_cov) / len(sample_cov)
-        target = np.eye(len(sample_cov)) * avg_var
-        target = pd.DataFrame(target, index=sample_cov.index, columns=sample_cov.columns)
+        # Statistics of the centered returns, with the 1/n normalization the
+        # Ledoit-Wolf estimator is derived for
+        centered = values - values.mean(axis=0)
+        scale = (n - 1) / n
+        emp_var = np.diag(sample_cov) * scale
+        mu = emp_var.mean()
+        emp_cov_sq = np.einsum('ij,ij->', sample_cov, sample_cov) * scale ** 2
         
-        # Shrinkage intensity (simplified - typically would be optimized)
-        shrinkage = 0.2
+        # Distance from the target and estimation error of the 1/n covariance;
+        # sum((X**2).T @ X**2) equals the sum of squared row norms squared
+        delta = (emp_cov_sq - 2 * mu * emp_var.sum() + k * mu ** 2) / k
+        row_sq = np.einsum('ij,ij->i', centered, centered)
+        beta = (np.sum(row_sq ** 2) / n - emp_cov_sq) / (k * n)
+        shrinkage = min(beta, delta) / delta if delta > 0 else 0.0
+        self.fitted_params['shrinkage'] = shrinkage
         
-        # Shrunk covariance matrix
-        shrunk_cov = shrinkage * target + (1 - shrinkage) * sample_cov
+        # Blend with the target (identity scaled by average variance) in one
+        # k x k pass, adding the target only where it is nonzero: the diagonal
+        avg_var = np.einsum('ii->', sample_cov) / k
+        shrunk_cov = sample_cov * (1 - shrinkage)
+        shrunk_cov.flat[::k + 1] += shrinkage * avg_var
         
         return shrunk_cov
     
+    def _sample_cov(self) -> np.ndarray:
+        """
+        Sample covariance of the fitted returns as a read-only k x k array.
+        
+        Computed once per fit and shared by the 'sample' and 'shrinkage'
+        covariance predictions.
+        """
+        values = self._data()
+        if self._sample_cov_np is None:
+            if self._has_nan:
+                # Fall back to pandas' pairwise NaN-aware covariance
+                cov = self._frame().cov().to_numpy(dtype=np.float64)
+            else:
+                cov = centered_covariance(values - values.mean(axis=0))
+            cov.setflags(write=False)
+            self._sample_cov_np = cov
+        return self._sample_cov_np
+    
+    def _sample_cholesky(self) -> Optional[np.ndarray]:
+        """
+        Lower Cholesky factor of the sample covariance, computed once per fit.
+        
+        None if the covariance is not positive definite.
+        """
+        cov = self._sample_cov()
+        if not self._factored:
+            try:
+                self._sample_chol = np.linalg.cholesky(cov.astype(np.float64))
+                self._sample_chol.setflags(write=False)
+            except np.linalg.LinAlgError:
+                self._sample_chol = None
+            self._factored = True
+        return self._sample_chol
+    
     def get_predictions(self, annualize: bool = True, 
-                       periods_per_year: int = 252) -> Dict[str, pd.DataFrame]:
+                       periods_per_year: int = 252) -> Dict[str, Any]:
         """
         Get both return predictions and covariance matrix.
         
+        The lower Cholesky factor of the covariance is included so it can be
+        passed to PortfolioOptimizer(chol=...), which then reuses it for every
+        volatility evaluation and closed-form solve instead of factoring the
+        matrix again.
+        
         Parameters:
         -----------
         annualize : bool, default=True
@@ -170,16 +357,113 @@ class TimeSeriesPredictor:
         Returns:
         --------
         dict
-            Dictionary containing 'returns' and 'covariance' predictions
+            'returns' : pd.Series of predicted returns
+            'covariance' : pd.DataFrame of the predicted covariance
+            'cholesky' : np.ndarray lower Cholesky factor of the covariance,
+            or None when the covariance is not positive definite
         """
-        expected_returns = self.predict_returns()
-        cov_matrix = self.predict_covariance()
+        expected_returns = self._predict_returns_array()
+        cov_matrix = self._covariance_array('sample')
+        chol = self._sample_cholesky()
         
+        # Both arrays are freshly allocated, so scale them in place and wrap
+        # them in pandas objects only once
         if annualize:
-            expected_returns = expected_returns * periods_per_year
-            cov_matrix = cov_matrix * periods_per_year
+            expected_returns *= periods_per_year
+            cov_matrix *= periods_per_year
+        
+        # chol(c * cov) = sqrt(c) * chol(cov); copy so the cached factor stays intact
+        if chol is not None:
+            chol = chol * np.sqrt(periods_per_year) if annualize else chol.copy()
         
         return {
-            'returns': expected_returns,
-            'covariance': cov_matrix
+            'returns': pd.Series(expected_returns, index=self._idx, copy=False),
+            'covariance': pd.DataFrame(cov_matrix, index=self._idx, columns=self._idx, copy=False),
+            'cholesky': chol
         }
+
+
+@functools.lru_cache(maxsize=32)
+def _ewma_weights(n: int, alpha: float, dtype: type = np.float64) -> np.ndarray:
+    """
+    Weights of n observations in the last value of an adjust=False EWMA.
+    
+    Unrolling y_t = alpha * x_t + (1 - alpha) * y_{t-1} from y_0 = x_0 gives
+    alpha * (1 - alpha)**(n - 1 - t) for t > 0 and (1 - alpha)**(n - 1) for t = 0.
+    Memoized, since repeated fits usually share the span and history length;
+    the returned array is read-only.
+    """
+    weights = alpha * (1.0 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    weights[0] = (1.0 - alpha) ** (n - 1)
+    weights = weights.astype(dtype, copy=False)
+    weights.setflags(write=False)
+    return weights
+
+
+def _ewma_last(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Last value of the adjust=False EWMA of each column.
+    
+    A single weights @ values product instead of a full n x k EWMA series.
+    """
+    return _ewma_weights(len(values), alpha, values.dtype) @ values
+
+
+def _ewma_cov_state(values: np.ndarray, alpha: float) -> Tuple[np.ndarray, float]:
+    """
+    Uncorrected adjust=False EWMA covariance and the sum of squared weights.
+    
+    Matches pandas ewm(adjust=False).cov() without its n x k x k panel. With
+    e_t = x_t - m_{t-1} the deviation from the previous EWMA mean, pandas'
+    recurrence reduces to S_t = (1 - alpha) * S_{t-1} + alpha * (1 - alpha) * e_t e_t',
+    so the last value is one weighted E' E product. The running means come
+    from a single IIR filter pass over the columns.
+    """
+    n = len(values)
+    decay = 1.0 - alpha
+    
+    # EWMA means m_0..m_{n-2}, started at m_0 = x_0
+    means = lfilter([alpha], [1.0, -decay], values[:-1], axis=0, zi=decay * values[:1])[0]
+    deviations = values[1:] - means
+    
+    # Deviation t is weighted alpha * decay**(n - t), i.e. decay times the
+    # weight of observation t in the EWMA mean
+    weights = decay * _ewma_weights(n, alpha, values.dtype)[1:]
+    cov = (deviations * weights[:, None]).T @ deviations
+    
+    return cov, np.square(_ewma_weights(n, alpha)).sum()
+
+
+def _bias_corrected(cov: np.ndarray, sum_sq: float) -> np.ndarray:
+    """Unbiased EWMA covariance: cov / (1 - sum of squared observation weights)."""
+    return cov / (1.0 - sum_sq) if sum_sq < 1.0 else np.full_like(cov, np.nan)
+
+
+def _ewma_cov_last(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Last value of the adjust=False, bias-corrected EWMA covariance."""
+    return _bias_corrected(*_ewma_cov_state(values, alpha))
+
+
+def _ewma_init(values: np.ndarray, alpha: float, with_cov: bool = True) -> Dict:
+    """
+    Running EWMA state after the given observations.
+    
+    Without with_cov only the mean is tracked and 'cov' is None.
+    """
+    mean = _ewma_last(values, alpha).astype(np.float64)
+    if not with_cov:
+        return {'mean': mean, 'cov': None, 'sum_sq': None}
+    cov, sum_sq = _ewma_cov_state(values, alpha)
+    return {'mean': mean, 'cov': cov.astype(np.float64), 'sum_sq': sum_sq}
+
+
+def _ewma_step(state: Dict, row: np.ndarray, alpha: float):
+    """Advance a running EWMA state by one observation, in place."""
+    decay = 1.0 - alpha
+    deviation = row - state['mean']
+    state['mean'] += alpha * deviation
+    if state['cov'] is None:
+        return
+    state['cov'] *= decay
+    state['cov'] += (alpha * decay) * np.outer(deviation, deviation)
+    state['sum_sq'] = state['sum_sq'] * decay ** 2 + alpha ** 2
@@ -4,7 +4,9 @@ Utility functions for financial calculations and data processing.
 
 import numpy as np
 import pandas as pd
-from typing import Union, Optional
+from scipy.linalg.blas import get_blas_funcs
+from collections import deque
+from typing import Union, Optional, Tuple
 
 
 def calculate_returns(prices: Union[pd.Series, pd.DataFrame], 
@@ -24,14 +26,31 @@ def calculate_returns(prices: Union[pd.Series, pd.DataFrame],
     pd.Series or pd.DataFrame
         Returns data
     """
-    if method == 'simple':
-        returns = prices.pct_change()
-    elif method == 'log':
-        returns = np.log(prices / prices.shift(1))
-    else:
+    # Work on the raw array, without pandas' shifted copies and alignment
+    values = prices.to_numpy(dtype=np.float64)
+    
+    if method not in ('simple', 'log'):
         raise ValueError(f"Unknown method: {method}. Use 'simple' or 'log'")
     
-    return returns.dropna()
+    returns = np.divide(values[1:], values[:-1])
+    returns -= 1.0
+    if method == 'log':
+        # log1p of the simple return is accurate for small returns, unlike a
+        # difference of nearly equal log prices
+        np.log1p(returns, out=returns)
+    
+    # Slicing off the first row already removed the undefined first return;
+    # dropna (a filtered copy) is only needed when prices have gaps
+    returns_obj = _wrap_returns(prices, returns)
+    return returns_obj.dropna() if np.isnan(returns).any() else returns_obj
+
+
+def _wrap_returns(prices: Union[pd.Series, pd.DataFrame],
+                  values: np.ndarray) -> Union[pd.Series, pd.DataFrame]:
+    """Wrap returns computed from consecutive prices in the pandas type of prices."""
+    if isinstance(prices, pd.DataFrame):
+        return pd.DataFrame(values, index=prices.index[1:], columns=prices.columns)
+    return pd.Series(values, index=prices.index[1:], name=prices.name)
 
 
 def calculate_volatility(returns: Union[pd.Series, pd.DataFrame], 
@@ -54,12 +73,21 @@ def calculate_volatility(returns: Union[pd.Series, pd.DataFrame],
     float or pd.Series
         Volatility (annualized if specified)
     """
-    vol = returns.std()
+    values = returns.to_numpy(dtype=np.float64)
+    
+    if np.isnan(values).any():
+        # Fall back to pandas' NaN-skipping standard deviation
+        vol = returns.std()
+        return vol * np.sqrt(periods_per_year) if annualize else vol
     
+    # One contiguous reduction, annualized in place
+    vol = np.atleast_1d(values.std(axis=0, ddof=1))
     if annualize:
-        vol = vol * np.sqrt(periods_per_year)
+        np.multiply(vol, np.sqrt(periods_per_year), out=vol)
     
-    return vol
+    if isinstance(returns, pd.DataFrame):
+        return pd.Series(vol, index=returns.columns)
+    return vol[0]
 
 
 def calculate_sharpe_ratio(returns: Union[pd.Series, pd.DataFrame],
@@ -95,9 +123,12 @@ def calculate_sharpe_ratio(returns: Union[pd.Series, pd.DataFrame],
     # Adjust for risk-free rate
     excess_return = mean_return - risk_free_rate
     
-    # Handle zero volatility case
+    # Handle zero volatility case: masked division straight into a NaN buffer
     if isinstance(std_return, pd.Series):
-        sharpe = excess_return / std_return.replace(0, np.nan)
+        excess = excess_return.to_numpy(dtype=np.float64)
+        std = std_return.to_numpy(dtype=np.float64)
+        sharpe = np.divide(excess, std, out=np.full_like(excess, np.nan), where=std != 0)
+        sharpe = pd.Series(sharpe, index=std_return.index)
     else:
         sharpe = excess_return / std_return if std_return != 0 else np.nan
     
@@ -124,7 +155,14 @@ def calculate_covariance_matrix(returns: pd.DataFrame,
     pd.DataFrame
         Covariance matrix
     """
-    cov_matrix = returns.cov()
+    values = returns.to_numpy(dtype=np.float64)
+    
+    if np.isnan(values).any():
+        # Fall back to pandas' pairwise NaN-aware covariance
+        cov_matrix = returns.cov()
+    else:
+        cov = centered_covariance(values - values.mean(axis=0))
+        cov_matrix = pd.DataFrame(cov, index=returns.columns, columns=returns.columns)
     
     if annualize:
         cov_matrix = cov_matrix * periods_per_year
@@ -132,6 +170,38 @@ def calculate_covariance_matrix(returns: pd.DataFrame,
     return cov_matrix
 
 
+def centered_covariance(centered: np.ndarray) -> np.ndarray:
+    """
+    Calculate the sample covariance Xc' Xc / (n - 1) of centered observations.
+    
+    Uses the BLAS symmetric rank-k update (syrk), which computes only the
+    upper triangle of the product, and mirrors it into the lower one.
+    
+    Parameters:
+    -----------
+    centered : np.ndarray
+        n x k array of observations in rows, with each column's mean removed
+        
+    Returns:
+    --------
+    np.ndarray
+        k x k covariance matrix, in the precision of the input
+    """
+    n = len(centered)
+    alpha = 1.0 / (n - 1) if n > 1 else np.nan
+    syrk = get_blas_funcs('syrk', (centered,))
+    
+    # BLAS wants column-major input: a C-ordered X is a column-major X'
+    if centered.flags.c_contiguous:
+        cov = syrk(alpha, centered.T)
+    else:
+        cov = syrk(alpha, centered, trans=1)
+    
+    lower = np.tril_indices(cov.shape[0], -1)
+    cov[lower] = cov.T[lower]
+    return cov
+
+
 def calculate_correlation_matrix(returns: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate correlation matrix of returns.
@@ -147,3 +217,145 @@ def calculate_correlation_matrix(returns: pd.DataFrame) -> pd.DataFrame:
         Correlation matrix
     """
     return returns.corr()
+
+
+def calculate_return_statistics(prices: pd.DataFrame,
+                                method: str = 'simple',
+                                annualize: bool = True,
+                                periods_per_year: int = 252,
+                                dtype: type = np.float64) -> Tuple[pd.Series, pd.DataFrame]:
+    """
+    Calculate expected returns and covariance matrix directly from prices.
+    
+    Returns are computed once as a NumPy array and both statistics are
+    derived from it, avoiding intermediate pandas objects.
+    
+    Parameters:
+    -----------
+    prices : pd.DataFrame
+        Price data without missing values
+    method : str, default='simple'
+        Method to calculate returns ('simple' or 'log')
+    annualize : bool, default=True
+        Whether to annualize the statistics
+    periods_per_year : int, default=252
+        Number of periods per year
+    dtype : type, default=np.float64
+        Working precision for the returns and covariance computation.
+        np.float32 halves memory traffic; results are always float64.
+        
+    Returns:
+    --------
+    tuple
+        (expected_returns, covariance_matrix)
+    """
+    values = prices.to_numpy(dtype=dtype)
+    
+    if method not in ('simple', 'log'):
+        raise ValueError(f"Unknown method: {method}. Use 'simple' or 'log'")
+    
+    # Single T x N work buffer: simple returns, log returns in place via
+    # log1p, then centered in place
+    returns = np.divide(values[1:], values[:-1])
+    returns -= 1.0
+    if method == 'log':
+        np.log1p(returns, out=returns)
+    
+    mean = returns.mean(axis=0)
+    returns -= mean
+    cov = centered_covariance(returns)
+    
+    if annualize:
+        mean = mean * periods_per_year
+        cov = cov * periods_per_year
+    
+    # Optimizers expect float64 regardless of the working precision
+    mean = mean.astype(np.float64, copy=False)
+    cov = cov.astype(np.float64, copy=False)
+    
+    expected_returns = pd.Series(mean, index=prices.columns)
+    covariance_matrix = pd.DataFrame(cov, index=prices.columns, columns=prices.columns)
+    
+    return expected_returns, covariance_matrix
+
+
+class RollingCov:
+    """
+    Online covariance estimator over a sliding window of observations.
+    
+    Maintains the running mean and scatter matrix with Welford's update,
+    so each new observation costs O(N^2) instead of recomputing the
+    covariance over the whole window.
+    """
+    
+    def __init__(self, window: Optional[int] = None):
+        """
+        Initialize the estimator.
+        
+        Parameters:
+        -----------
+        window : int, optional
+            Number of most recent observations to keep. If None, all
+            observations are used (expanding window).
+        """
+        if window is not None and window < 2:
+            raise ValueError("window must be at least 2")
+        
+        self.window = window
+        self.n = 0
+        self.mean = None
+        self.M2 = None
+        self._observations = deque()
+    
+    def push(self, x: np.ndarray) -> 'RollingCov':
+        """
+        Add a new observation (one return per asset).
+        
+        Parameters:
+        -----------
+        x : np.ndarray
+            Observation vector
+            
+        Returns:
+        --------
+        self : RollingCov
+        """
+        # Copy: windowed observations are kept, and callers may reuse a buffer
+        x = np.array(x, dtype=np.float64)
+        
+        if self.mean is None:
+            self.mean = np.zeros_like(x)
+            self.M2 = np.zeros((len(x), len(x)))
+        
+        # Add the new observation
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.M2 += np.outer(delta, x - self.mean)
+        
+        if self.window is not None:
+            self._observations.append(x)
+            
+            # Remove the oldest observation once the window is full
+            if self.n > self.window:
+                old = self._observations.popleft()
+                self.n -= 1
+                delta = old - self.mean
+                self.mean -= delta / self.n
+                self.M2 -= np.outer(delta, old - self.mean)
+        
+        return self
+    
+    def cov(self) -> np.ndarray:
+        """
+        Return the sample covariance of the current window.
+        
+        Returns:
+        --------
+        np.ndarray
+            Covariance matrix
+        """
+        if self.n < 2:
+            raise ValueError("At least 2 observations are required")
+        
+        return self.M2 / (self.n - 1)
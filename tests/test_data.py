@@ -0,0 +1,94 @@
+"""
+Unit tests for market data helpers.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+import tempfile
+from unittest import mock
+import numpy as np
+import pandas as pd
+from finean import data
+
+
+class TestCachedDownload(unittest.TestCase):
+    """Test cases for cached_download."""
+
+    def setUp(self):
+        """Set up a temporary cache directory and sample data."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = self.tmpdir.name
+
+        dates = pd.date_range('2020-01-01', periods=10, freq='D')
+        self.sample = pd.DataFrame({
+            'AAA': np.linspace(100, 110, 10),
+            'BBB': np.linspace(50, 45, 10)
+        }, index=dates)
+
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.tmpdir.cleanup()
+
+    def test_second_call_uses_cache(self):
+        """Test that a fresh cache entry avoids a second download."""
+        with mock.patch.object(data.yf, 'download', return_value=self.sample) as download:
+            first = data.cached_download(['AAA', 'BBB'], cache_dir=self.cache_dir)
+            second = data.cached_download(['BBB', 'AAA'], cache_dir=self.cache_dir)
+
+        self.assertEqual(download.call_count, 1)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_expired_cache_downloads_again(self):
+        """Test that a stale cache entry triggers a new download."""
+        with mock.patch.object(data.yf, 'download', return_value=self.sample) as download:
+            data.cached_download(['AAA'], cache_dir=self.cache_dir)
+            data.cached_download(['AAA'], cache_dir=self.cache_dir, ttl=0)
+
+        self.assertEqual(download.call_count, 2)
+
+    def test_transport_options_share_cache(self):
+        """Test that transport-only options do not change the cache key."""
+        with mock.patch.object(data.yf, 'download', return_value=self.sample) as download:
+            data.cached_download(['AAA'], cache_dir=self.cache_dir, progress=False)
+            data.cached_download(['AAA'], cache_dir=self.cache_dir, threads=False)
+
+        self.assertEqual(download.call_count, 1)
+        self.assertTrue(download.call_args.kwargs['threads'])
+
+    def test_no_cache_env_bypasses_cache(self):
+        """Test that FINEAN_NO_CACHE skips reading and writing the cache."""
+        with mock.patch.dict(os.environ, {'FINEAN_NO_CACHE': '1'}), \
+                mock.patch.object(data.yf, 'download', return_value=self.sample) as download:
+            data.cached_download(['AAA'], cache_dir=self.cache_dir)
+            data.cached_download(['AAA'], cache_dir=self.cache_dir)
+
+        self.assertEqual(download.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_empty_result_not_cached(self):
+        """Test that empty downloads are not written to the cache."""
+        with mock.patch.object(data.yf, 'download', return_value=pd.DataFrame()):
+            data.cached_download(['AAA'], cache_dir=self.cache_dir)
+
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+    def test_unreadable_cache_downloads_again(self):
+        """Test that a corrupt cache file is replaced by a new download."""
+        with mock.patch.object(data.yf, 'download', return_value=self.sample) as download:
+            data.cached_download(['AAA'], cache_dir=self.cache_dir)
+            [name] = os.listdir(self.cache_dir)
+            with open(os.path.join(self.cache_dir, name), 'wb') as f:
+                f.write(b'truncated')
+            result = data.cached_download(['AAA'], cache_dir=self.cache_dir)
+
+        self.assertEqual(download.call_count, 2)
+        pd.testing.assert_frame_equal(result, self.sample)
+        self.assertEqual(os.listdir(self.cache_dir), [name])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests for the shared data pipeline.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+import numpy as np
+import pandas as pd
+from finean import pipeline
+
+
+class TestPipeline(unittest.TestCase):
+    """Test cases for the memoized pipeline helpers."""
+
+    def setUp(self):
+        """Clear the in-process caches and build a grouped-by-ticker download."""
+        pipeline._fetch.cache_clear()
+        pipeline._metrics.cache_clear()
+
+        dates = pd.date_range('2020-01-01', periods=50, freq='D')
+        np.random.seed(42)
+        columns = pd.MultiIndex.from_product([['AAA', 'BBB', 'CCC'], ['Open', 'Close']])
+        values = 100 + np.cumsum(np.random.randn(50, 6), axis=0)
+        self.download = pd.DataFrame(values, index=dates, columns=columns)
+
+    def test_fetch_prices_extracts_close(self):
+        """Test that closing prices are extracted from the grouped layout."""
+        with mock.patch.object(pipeline, 'cached_download', return_value=self.download):
+            prices = pipeline.fetch_prices(['AAA', 'BBB', 'CCC'])
+
+        self.assertEqual(list(prices.columns), ['AAA', 'BBB', 'CCC'])
+        np.testing.assert_array_equal(prices['AAA'].values, self.download[('AAA', 'Close')].values)
+
+    def test_repeated_requests_are_memoized(self):
+        """Test that the same request downloads and computes only once."""
+        with mock.patch.object(pipeline, 'cached_download', return_value=self.download) as download:
+            first = pipeline.portfolio_metrics(['AAA', 'BBB', 'CCC'])
+            second = pipeline.portfolio_metrics(['AAA', 'BBB', 'CCC'])
+            pipeline.fetch_prices(['AAA', 'BBB', 'CCC'])
+
+        self.assertEqual(download.call_count, 1)
+        self.assertIs(first, second)
+
+        expected_returns, covariance_matrix, chol = first
+        np.testing.assert_allclose(chol @ chol.T, covariance_matrix.values)
+
+    def test_correlation_rows_are_labelled(self):
+        """Test that each printed correlation row starts with its ticker."""
+        output = io.StringIO()
+        with mock.patch.object(pipeline, 'cached_download', return_value=self.download), \
+                redirect_stdout(output):
+            pipeline.calculate_portfolio_metrics(['AAA', 'BBB', 'CCC'])
+
+        lines = output.getvalue().split('Matriz de Correlación:')[1].splitlines()[2:6]
+        self.assertEqual(lines[0].split(), ['AAA', 'BBB', 'CCC'])
+        for ticker, line in zip(['AAA', 'BBB', 'CCC'], lines[1:]):
+            self.assertEqual(line.split()[0], ticker)
+            self.assertEqual(len(line.split()), 4)
+
+    def test_rolling_covariance(self):
+        """Test rolling covariance matches pandas for every window."""
+        returns = self.download.xs('Close', axis=1, level=1).pct_change().iloc[1:]
+        window = 20
+        covariances = pipeline.rolling_covariance(returns, window)
+
+        self.assertEqual(covariances.shape, (len(returns) - window + 1, 3, 3))
+        np.testing.assert_allclose(covariances[0], returns.iloc[:window].cov().values)
+        np.testing.assert_allclose(covariances[-1], returns.iloc[-window:].cov().values)
+
+        with self.assertRaises(ValueError):
+            pipeline.rolling_covariance(returns, 1)
+
+    def test_run_selected_strategies(self):
+        """Test that run optimizes and reports only the selected strategies."""
+        output = io.StringIO()
+        with mock.patch.object(pipeline, 'cached_download', return_value=self.download), \
+                redirect_stdout(output):
+            code = pipeline.run(['AAA', 'BBB', 'CCC'], strategies=('max_sharpe', 'min_vol'),
+                                max_weight=1.0, plot=False)
+
+        self.assertEqual(code, 0)
+        self.assertIn(pipeline.STRATEGIES['max_sharpe']['title'], output.getvalue())
+        self.assertIn(pipeline.STRATEGIES['min_vol']['title'], output.getvalue())
+        self.assertNotIn(pipeline.STRATEGIES['max_return']['title'], output.getvalue())
+
+    def test_parallel_strategies_match_sequential(self):
+        """Test that solving strategies in worker processes gives the same results."""
+        with mock.patch.object(pipeline, 'cached_download', return_value=self.download):
+            expected_returns, covariance_matrix, chol = pipeline.portfolio_metrics(['AAA', 'BBB', 'CCC'])
+
+        optimizer = pipeline.PortfolioOptimizer(expected_returns, covariance_matrix, chol=chol)
+        strategies = ('max_sharpe', 'min_vol', 'max_return')
+        constraints = {'long_only': True, 'max_weight': 0.6}
+
+        sequential = pipeline._optimize_strategies(optimizer, strategies, constraints, n_jobs=1)
+        parallel = pipeline._optimize_strategies(optimizer, strategies, constraints, n_jobs=2)
+
+        for key in strategies:
+            pd.testing.assert_series_equal(parallel[key]['weights'], sequential[key]['weights'])
+
+    def test_run_rejects_unknown_strategy(self):
+        """Test that unknown strategy names raise an error."""
+        with self.assertRaises(ValueError):
+            pipeline.run(['AAA'], strategies=('invalid',))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,8 +7,10 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import unittest
+from unittest import mock
 import numpy as np
 import pandas as pd
+from scipy.optimize import approx_fprime
 from finean.portfolio_optimizer import PortfolioOptimizer
 
 
@@ -49,6 +51,37 @@ class TestPortfolioOptimizer(unittest.TestCase):
         self.assertEqual(optimizer.n_assets, 3)
         self.assertEqual(len(optimizer.assets), 3)
     
+    def test_asymmetric_covariance_is_symmetrized(self):
+        """Test that an asymmetric covariance matrix is symmetrized."""
+        asymmetric = self.cov_matrix.copy()
+        asymmetric.iloc[0, 1] += 0.002
+        
+        optimizer = PortfolioOptimizer(
+            expected_returns=self.expected_returns,
+            covariance_matrix=asymmetric
+        )
+        
+        np.testing.assert_array_equal(optimizer.cov_matrix.values, optimizer.cov_matrix.values.T)
+        self.assertAlmostEqual(optimizer.cov_matrix.iloc[0, 1], 0.011)
+        pd.testing.assert_frame_equal(
+            PortfolioOptimizer(self.expected_returns, self.cov_matrix).cov_matrix,
+            self.cov_matrix
+        )
+
+    def test_ndarray_inputs(self):
+        """Test that plain arrays are accepted for the inputs."""
+        reference = PortfolioOptimizer(self.expected_returns, self.cov_matrix, risk_free_rate=0.02)
+        labelled = PortfolioOptimizer(self.expected_returns, self.cov_matrix.values,
+                                      risk_free_rate=0.02)
+        unlabelled = PortfolioOptimizer(self.expected_returns.values, self.cov_matrix.values,
+                                        risk_free_rate=0.02)
+
+        expected = reference.optimize_max_sharpe()['weights']
+        pd.testing.assert_series_equal(labelled.optimize_max_sharpe()['weights'], expected)
+        self.assertEqual(unlabelled.assets, [0, 1, 2])
+        np.testing.assert_allclose(unlabelled.optimize_max_sharpe()['weights'].values,
+                                   expected.values)
+
     def test_optimize_max_sharpe(self):
         """Test maximum Sharpe ratio optimization."""
         optimizer = PortfolioOptimizer(
@@ -93,6 +126,24 @@ class TestPortfolioOptimizer(unittest.TestCase):
         # Check volatility is positive
         self.assertGreater(result['volatility'], 0)
     
+    def test_closed_form_unconstrained(self):
+        """Test closed-form solutions when only the sum-to-1 constraint binds."""
+        optimizer = PortfolioOptimizer(
+            expected_returns=self.expected_returns,
+            covariance_matrix=self.cov_matrix,
+            risk_free_rate=0.02
+        )
+        constraints = {'long_only': False, 'max_weight': 10.0}
+        inv_cov = np.linalg.inv(self.cov_matrix.values)
+        
+        tangency = inv_cov @ (self.expected_returns.values - 0.02)
+        result = optimizer.optimize_max_sharpe(constraints=constraints)
+        np.testing.assert_allclose(result['weights'].values, tangency / tangency.sum())
+        
+        min_var = inv_cov @ np.ones(3)
+        result = optimizer.optimize_min_volatility(constraints=constraints)
+        np.testing.assert_allclose(result['weights'].values, min_var / min_var.sum())
+    
     def test_optimize_max_return_for_risk(self):
         """Test optimization for maximum return given target risk."""
         optimizer = PortfolioOptimizer(
@@ -114,6 +165,39 @@ class TestPortfolioOptimizer(unittest.TestCase):
         # Check volatility is at or below target (with tolerance)
         self.assertLessEqual(result['volatility'], target_vol + 0.01)
     
+    def test_closed_form_frontier_point(self):
+        """Test the closed-form frontier point matches SLSQP when no bound binds."""
+        optimizer = PortfolioOptimizer(
+            expected_returns=self.expected_returns,
+            covariance_matrix=self.cov_matrix
+        )
+        constraints = {'long_only': False, 'max_weight': 10.0}
+        target_vol = 0.25
+        
+        result = optimizer.optimize_max_return_for_risk(target_vol, constraints)
+        self.assertAlmostEqual(result['volatility'], target_vol, places=10)
+        self.assertAlmostEqual(result['weights'].sum(), 1.0, places=10)
+        
+        # Without the Cholesky factor the same point is found iteratively
+        optimizer._L = None
+        optimizer._frontier_params = None
+        slsqp_result = optimizer.optimize_max_return_for_risk(target_vol, constraints)
+        self.assertAlmostEqual(result['expected_return'], slsqp_result['expected_return'], places=5)
+    
+    def test_efficient_frontier_closed_form_batch(self):
+        """Test the batched closed-form frontier hits every target volatility."""
+        optimizer = PortfolioOptimizer(
+            expected_returns=self.expected_returns,
+            covariance_matrix=self.cov_matrix
+        )
+        constraints = {'long_only': False, 'max_weight': 10.0}
+        
+        frontier = optimizer.calculate_efficient_frontier(n_points=10, constraints=constraints)
+        target_vols = optimizer._frontier_target_volatilities(10, constraints)
+        
+        np.testing.assert_allclose(frontier['volatility'], target_vols)
+        self.assertTrue(frontier['expected_return'].is_monotonic_increasing)
+    
     def test_weight_constraints(self):
         """Test portfolio optimization with weight constraints."""
         optimizer = PortfolioOptimizer(
@@ -156,6 +240,20 @@ class TestPortfolioOptimizer(unittest.TestCase):
         # Check returns increase with volatility (generally true for efficient frontier)
         self.assertTrue((frontier['expected_return'].diff().dropna() >= -0.01).all())
     
+    def test_calculate_efficient_frontier_parallel(self):
+        """Test parallel efficient frontier matches the sequential one."""
+        optimizer = PortfolioOptimizer(
+            expected_returns=self.expected_returns,
+            covariance_matrix=self.cov_matrix
+        )
+        
+        frontier = optimizer.calculate_efficient_frontier(n_points=10)
+        frontier_parallel = optimizer.calculate_efficient_frontier_parallel(n_points=10, n_jobs=2)
+        frontier_flag = optimizer.calculate_efficient_frontier(n_points=10, parallel=True, n_jobs=2)
+        
+        pd.testing.assert_frame_equal(frontier, frontier_parallel, atol=1e-6)
+        pd.testing.assert_frame_equal(frontier_flag, frontier_parallel)
+    
     def test_get_portfolio_statistics(self):
         """Test calculation of portfolio statistics."""
         optimizer = PortfolioOptimizer(
@@ -230,6 +328,70 @@ class TestPortfolioOptimizer(unittest.TestCase):
         expected_sharpe = (portfolio_return - 0.02) / portfolio_vol
         
         self.assertAlmostEqual(sharpe, expected_sharpe, places=10)
+        
+        # A riskless portfolio has a Sharpe ratio of 0
+        self.assertEqual(optimizer._calculate_sharpe_ratio(np.zeros(3)), 0.0)
+    
+    def test_precomputed_cholesky(self):
+        """Test that a precomputed Cholesky factor is used as given."""
+        chol = np.linalg.cholesky(self.cov_matrix.values)
+        optimizer = PortfolioOptimizer(
+            expected_returns=self.expected_returns,
+            covariance_matrix=self.cov_matrix,
+            chol=chol
+        )
+
+        np.testing.assert_array_equal(optimizer._L, chol)
+        weights = np.array([0.2, 0.3, 0.5])
+        expected = np.sqrt(weights @ self.cov_matrix.values @ weights)
+        self.assertAlmostEqual(optimizer._calculate_portfolio_volatility(weights), expected, places=10)
+
+    def test_cholesky_factored_once_on_demand(self):
+        """Test that the covariance is factored lazily and shared across strategies."""
+        optimizer = PortfolioOptimizer(self.expected_returns, self.cov_matrix)
+
+        with mock.patch('numpy.linalg.cholesky', wraps=np.linalg.cholesky) as cholesky:
+            optimizer.optimize_max_sharpe()
+            optimizer.optimize_min_volatility()
+            optimizer.optimize_max_return_for_risk(0.25)
+
+        self.assertEqual(cholesky.call_count, 1)
+
+    def test_volatility_with_singular_covariance(self):
+        """Test volatility falls back to the quadratic form when Cholesky fails."""
+        singular_cov = pd.DataFrame(np.ones((3, 3)) * 0.04,
+                                    index=self.assets, columns=self.assets)
+        optimizer = PortfolioOptimizer(
+            expected_returns=self.expected_returns,
+            covariance_matrix=singular_cov
+        )
+
+        self.assertIsNone(optimizer._L)
+        weights = np.array([0.5, 0.25, 0.25])
+        self.assertAlmostEqual(optimizer._calculate_portfolio_volatility(weights), 0.2, places=10)
+    
+    def test_analytic_gradients(self):
+        """Test analytic gradients against finite differences."""
+        optimizer = PortfolioOptimizer(
+            expected_returns=self.expected_returns,
+            covariance_matrix=self.cov_matrix,
+            risk_free_rate=0.02
+        )
+        weights = np.array([0.2, 0.3, 0.5])
+
+        # With the Cholesky factor and with the quadratic-form fallback
+        for chol in (optimizer._L, None):
+            optimizer._L = chol
+            np.testing.assert_allclose(
+                optimizer._portfolio_volatility_gradient(weights),
+                approx_fprime(weights, optimizer._calculate_portfolio_volatility, 1e-8),
+                rtol=1e-5
+            )
+            np.testing.assert_allclose(
+                optimizer._sharpe_ratio_gradient(weights),
+                approx_fprime(weights, optimizer._calculate_sharpe_ratio, 1e-8),
+                rtol=1e-5
+            )
 
 
 if __name__ == '__main__':
@@ -63,6 +63,18 @@ class TestTimeSeriesPredictor(unittest.TestCase):
         # Check all values are finite
         self.assertTrue(np.isfinite(predictions).all())
     
+    def test_predict_returns_ewma_matches_pandas(self):
+        """Test EWMA and EMA predictions match the last pandas EWM value."""
+        predictor = TimeSeriesPredictor(method='ewma')
+        predictor.fit(self.returns, span=60)
+        expected = self.returns.ewm(span=60, adjust=False).mean().iloc[-1]
+        pd.testing.assert_series_equal(predictor.predict_returns(), expected, check_names=False)
+        
+        predictor = TimeSeriesPredictor(method='ema')
+        predictor.fit(self.returns, window=30)
+        expected = self.returns.ewm(span=30, adjust=False).mean().iloc[-1]
+        pd.testing.assert_series_equal(predictor.predict_returns(), expected, check_names=False)
+    
     def test_predict_returns_sma(self):
         """Test SMA prediction."""
         predictor = TimeSeriesPredictor(method='sma')
@@ -75,6 +87,10 @@ class TestTimeSeriesPredictor(unittest.TestCase):
         
         # Check all values are finite
         self.assertTrue(np.isfinite(predictions).all())
+        
+        # Should be equal to the mean of the last window
+        expected = self.returns.rolling(window=30).mean().iloc[-1]
+        pd.testing.assert_series_equal(predictions, expected, check_names=False)
     
     def test_predict_returns_historical_mean(self):
         """Test historical mean prediction."""
@@ -105,6 +121,20 @@ class TestTimeSeriesPredictor(unittest.TestCase):
         
         # Check positive diagonal
         self.assertTrue((np.diag(cov) > 0).all())
+        
+        # Should be equal to the pandas sample covariance
+        pd.testing.assert_frame_equal(cov, self.returns.cov())
+    
+    def test_predict_covariance_ewma_matches_pandas(self):
+        """Test EWMA covariance matches the last block of pandas EWM covariance."""
+        predictor = TimeSeriesPredictor(method='ewma')
+        predictor.fit(self.returns, span=60)
+        
+        cov = predictor.predict_covariance(method='ewma')
+        expected = self.returns.ewm(span=60, adjust=False).cov().iloc[-3:]
+        
+        self.assertEqual(list(cov.index), list(self.returns.columns))
+        np.testing.assert_allclose(cov.values, expected.values, rtol=1e-10)
     
     def test_predict_covariance_shrinkage(self):
         """Test shrinkage covariance prediction."""
@@ -121,6 +151,42 @@ class TestTimeSeriesPredictor(unittest.TestCase):
         
         # Check positive diagonal
         self.assertTrue((np.diag(cov) > 0).all())
+        
+        # Check it blends the sample covariance with the scaled identity
+        shrinkage = predictor.fitted_params['shrinkage']
+        self.assertTrue(0 <= shrinkage <= 1)
+        sample_cov = self.returns.cov().values
+        target = np.eye(3) * np.trace(sample_cov) / 3
+        np.testing.assert_allclose(cov.values, shrinkage * target + (1 - shrinkage) * sample_cov)
+    
+    def test_sample_covariance_memoized(self):
+        """Test that the sample covariance is computed once per fit and not exposed."""
+        predictor = TimeSeriesPredictor(method='historical_mean')
+        predictor.fit(self.returns)
+        
+        sample = predictor.predict_covariance(method='sample')
+        predictor.predict_covariance(method='shrinkage')
+        self.assertIs(predictor._sample_cov(), predictor._sample_cov_np)
+        
+        # Annualizing the predictions must not leak into the cached matrix
+        predictor.get_predictions(annualize=True)
+        pd.testing.assert_frame_equal(predictor.predict_covariance(method='sample'), sample)
+        
+        predictor.fit(self.returns.iloc[:100])
+        self.assertIsNone(predictor._sample_cov_np)
+    
+    def test_ledoit_wolf_intensity(self):
+        """Test that the shrinkage intensity grows as observations get scarce."""
+        np.random.seed(0)
+        mixing = np.random.randn(10, 10)
+        intensities = []
+        for n_obs in (20, 2000):
+            returns = pd.DataFrame(np.random.randn(n_obs, 10) @ mixing * 0.01)
+            predictor = TimeSeriesPredictor().fit(returns)
+            predictor.predict_covariance(method='shrinkage')
+            intensities.append(predictor.fitted_params['shrinkage'])
+        
+        self.assertGreater(intensities[0], intensities[1])
     
     def test_get_predictions(self):
         """Test getting both returns and covariance."""
@@ -137,6 +203,21 @@ class TestTimeSeriesPredictor(unittest.TestCase):
         self.assertEqual(len(predictions['returns']), 3)
         self.assertEqual(predictions['covariance'].shape, (3, 3))
     
+    def test_get_predictions_cholesky(self):
+        """Test the returned Cholesky factor matches the covariance and feeds the optimizer."""
+        from finean.portfolio_optimizer import PortfolioOptimizer
+        
+        predictor = TimeSeriesPredictor(method='historical_mean').fit(self.returns)
+        for annualize in (False, True):
+            predictions = predictor.get_predictions(annualize=annualize)
+            chol = predictions['cholesky']
+            np.testing.assert_allclose(chol @ chol.T, predictions['covariance'].values)
+        
+        optimizer = PortfolioOptimizer(predictions['returns'], predictions['covariance'], chol=chol)
+        reference = PortfolioOptimizer(predictions['returns'], predictions['covariance'])
+        pd.testing.assert_series_equal(optimizer.optimize_min_volatility()['weights'],
+                                       reference.optimize_min_volatility()['weights'])
+    
     def test_get_predictions_annualized(self):
         """Test that annualization scales properly."""
         predictor = TimeSeriesPredictor(method='historical_mean')
@@ -157,6 +238,98 @@ class TestTimeSeriesPredictor(unittest.TestCase):
             pred_daily['covariance'].values * 252
         ))
     
+    def test_update_matches_refit(self):
+        """Test that online updates give the same predictions as refitting."""
+        full = TimeSeriesPredictor(method='ewma').fit(self.returns, span=60)
+        online = TimeSeriesPredictor(method='ewma').fit(self.returns.iloc[:150], span=60)
+        for i in range(150, 200):
+            row = self.returns.iloc[i]
+            online.update(row if i % 2 else row.values)
+        
+        pd.testing.assert_series_equal(online.predict_returns(), full.predict_returns())
+        for method in ('ewma', 'sample', 'shrinkage'):
+            pd.testing.assert_frame_equal(online.predict_covariance(method),
+                                          full.predict_covariance(method))
+        
+        sma = TimeSeriesPredictor(method='sma').fit(self.returns.iloc[:190], window=30)
+        for i in range(190, 200):
+            sma.update(self.returns.iloc[i])
+        expected = TimeSeriesPredictor(method='sma').fit(self.returns, window=30).predict_returns()
+        pd.testing.assert_series_equal(sma.predict_returns(), expected)
+        self.assertEqual(sma._ewma_state, {})
+        
+        # A caller streaming rows through one reused buffer
+        buf = np.empty(3)
+        for method in ('sma', 'historical_mean', 'ewma'):
+            reused = TimeSeriesPredictor(method=method).fit(self.returns.iloc[:150])
+            for i in range(150, 200):
+                buf[:] = self.returns.values[i]
+                reused.update(buf)
+            refit = TimeSeriesPredictor(method=method).fit(self.returns)
+            pd.testing.assert_series_equal(reused.predict_returns(), refit.predict_returns())
+            pd.testing.assert_frame_equal(reused.predict_covariance('sample'),
+                                          refit.predict_covariance('sample'))
+        
+        with self.assertRaises(ValueError):
+            sma.update(np.zeros(4))
+        pd.testing.assert_series_equal(sma.predict_returns(), expected)
+        
+        # 'ema' tracks only its own mean; the covariance is refit from the data
+        ema = TimeSeriesPredictor(method='ema').fit(self.returns.iloc[:190], window=30)
+        for i in range(190, 200):
+            ema.update(self.returns.iloc[i])
+        refit = TimeSeriesPredictor(method='ema').fit(self.returns, window=30)
+        self.assertEqual(list(ema._ewma_state), [2.0 / 31])
+        pd.testing.assert_series_equal(ema.predict_returns(), refit.predict_returns())
+        pd.testing.assert_frame_equal(ema.predict_covariance('ewma'), refit.predict_covariance('ewma'))
+    
+    def test_float32_working_precision(self):
+        """Test float32 working precision returns float64 close to float64 results."""
+        predictor = TimeSeriesPredictor(method='ewma').fit(self.returns, span=60)
+        predictor32 = TimeSeriesPredictor(method='ewma', dtype=np.float32).fit(self.returns, span=60)
+        
+        self.assertEqual(predictor32._A.dtype, np.float32)
+        self.assertTrue(predictor32._A.flags.f_contiguous)
+        
+        predictions = predictor.get_predictions()
+        predictions32 = predictor32.get_predictions()
+        self.assertEqual(predictions32['returns'].dtype, np.float64)
+        self.assertEqual(predictions32['covariance'].values.dtype, np.float64)
+        np.testing.assert_allclose(predictions32['returns'], predictions['returns'], rtol=1e-3, atol=1e-6)
+        np.testing.assert_allclose(predictions32['covariance'], predictions['covariance'], rtol=1e-3, atol=1e-7)
+    
+    def test_missing_values_match_pandas(self):
+        """Test that NaN returns fall back to pandas' NaN-aware estimators."""
+        returns = self.returns.copy()
+        returns.iloc[[5, 120], 0] = np.nan
+        returns.iloc[190, 1] = np.nan
+    
+        ewma = TimeSeriesPredictor(method='ewma').fit(returns, span=60)
+        expected = returns.ewm(span=60, adjust=False).mean().iloc[-1]
+        np.testing.assert_allclose(ewma.predict_returns(), expected, rtol=1e-10)
+        expected_cov = returns.ewm(span=60, adjust=False).cov().iloc[-3:]
+        np.testing.assert_allclose(ewma.predict_covariance(method='ewma'), expected_cov, rtol=1e-10)
+    
+        sma = TimeSeriesPredictor(method='sma').fit(returns, window=30)
+        expected = returns.rolling(window=30).mean().iloc[-1]
+        np.testing.assert_allclose(sma.predict_returns(), expected, rtol=1e-10)
+    
+        mean = TimeSeriesPredictor(method='historical_mean').fit(returns)
+        np.testing.assert_allclose(mean.predict_returns(), returns.mean(), rtol=1e-10)
+        pd.testing.assert_frame_equal(mean.predict_covariance(method='sample'), returns.cov())
+    
+        shrunk = mean.predict_covariance(method='shrinkage').values
+        self.assertFalse(np.isnan(shrunk).any())
+        self.assertTrue(np.isfinite(mean.get_predictions()['returns']).all())
+    
+        # A gap arriving through update() also leaves the online state
+        updated = TimeSeriesPredictor(method='ewma').fit(self.returns.iloc[:180], span=60)
+        for i in range(180, 200):
+            updated.update(returns.iloc[i])
+        combined = pd.concat([self.returns.iloc[:180], returns.iloc[180:]])
+        expected = combined.ewm(span=60, adjust=False).mean().iloc[-1]
+        np.testing.assert_allclose(updated.predict_returns(), expected, rtol=1e-10)
+    
     def test_invalid_method(self):
         """Test that invalid method raises error."""
         predictor = TimeSeriesPredictor(method='invalid_method')
@@ -14,7 +14,10 @@ from finean.utils import (
     calculate_volatility,
     calculate_sharpe_ratio,
     calculate_covariance_matrix,
-    calculate_correlation_matrix
+    centered_covariance,
+    calculate_correlation_matrix,
+    calculate_return_statistics,
+    RollingCov
 )
 
 
@@ -63,6 +66,16 @@ class TestUtils(unittest.TestCase):
         expected_first = np.log(self.prices.iloc[1, 0] / self.prices.iloc[0, 0])
         self.assertAlmostEqual(returns.iloc[0, 0], expected_first, places=10)
     
+    def test_calculate_returns_with_missing_prices(self):
+        """Test that returns touching a missing price are dropped."""
+        prices = self.prices.copy()
+        prices.iloc[10, 1] = np.nan
+        returns = calculate_returns(prices)
+        
+        self.assertEqual(len(returns), len(self.prices) - 3)
+        self.assertFalse(returns.isna().any().any())
+        pd.testing.assert_frame_equal(returns, prices.pct_change(fill_method=None).dropna())
+    
     def test_calculate_returns_invalid_method(self):
         """Test that invalid method raises error."""
         with self.assertRaises(ValueError):
@@ -82,6 +95,19 @@ class TestUtils(unittest.TestCase):
         vol_annual = calculate_volatility(self.returns, annualize=True, periods_per_year=252)
         self.assertGreater(vol_annual.iloc[0], vol.iloc[0])
     
+    def test_calculate_volatility_matches_pandas(self):
+        """Test volatility matches pandas for frames, series and missing values."""
+        vol = calculate_volatility(self.returns, periods_per_year=252)
+        pd.testing.assert_series_equal(vol, self.returns.std() * np.sqrt(252))
+        
+        series_vol = calculate_volatility(self.returns['Asset_A'], annualize=False)
+        self.assertAlmostEqual(series_vol, self.returns['Asset_A'].std(), places=12)
+        
+        returns_nan = self.returns.copy()
+        returns_nan.iloc[5, 1] = np.nan
+        pd.testing.assert_series_equal(calculate_volatility(returns_nan, annualize=False),
+                                       returns_nan.std())
+    
     def test_calculate_sharpe_ratio(self):
         """Test Sharpe ratio calculation."""
         sharpe = calculate_sharpe_ratio(self.returns, risk_free_rate=0.0, annualize=False)
@@ -100,6 +126,16 @@ class TestUtils(unittest.TestCase):
         # Sharpe with positive RF should be lower
         self.assertTrue((sharpe_with_rf <= sharpe_no_rf).all())
     
+    def test_calculate_sharpe_ratio_zero_volatility(self):
+        """Test that assets with zero volatility get a NaN Sharpe ratio."""
+        returns = self.returns.copy()
+        returns['Asset_B'] = 0.0
+        sharpe = calculate_sharpe_ratio(returns, annualize=False)
+        
+        self.assertTrue(np.isnan(sharpe['Asset_B']))
+        expected = returns['Asset_A'].mean() / returns['Asset_A'].std()
+        self.assertAlmostEqual(sharpe['Asset_A'], expected, places=10)
+    
     def test_calculate_covariance_matrix(self):
         """Test covariance matrix calculation."""
         cov_matrix = calculate_covariance_matrix(self.returns, annualize=False)
@@ -117,6 +153,26 @@ class TestUtils(unittest.TestCase):
         cov_annual = calculate_covariance_matrix(self.returns, annualize=True, periods_per_year=252)
         self.assertGreater(cov_annual.iloc[0, 0], cov_matrix.iloc[0, 0])
     
+    def test_calculate_covariance_matrix_matches_pandas(self):
+        """Test covariance matrix matches pandas, with and without NaNs."""
+        cov_matrix = calculate_covariance_matrix(self.returns, annualize=False)
+        pd.testing.assert_frame_equal(cov_matrix, self.returns.cov())
+
+        returns_nan = self.returns.copy()
+        returns_nan.iloc[5, 1] = np.nan
+        cov_nan = calculate_covariance_matrix(returns_nan, annualize=False)
+        pd.testing.assert_frame_equal(cov_nan, returns_nan.cov())
+
+    def test_centered_covariance(self):
+        """Test syrk covariance matches NumPy for C- and Fortran-ordered input."""
+        values = self.returns.to_numpy()
+        centered = values - values.mean(axis=0)
+        expected = np.cov(values, rowvar=False)
+        for order in ('C', 'F'):
+            cov = centered_covariance(np.asarray(centered, order=order))
+            np.testing.assert_allclose(cov, expected)
+            np.testing.assert_array_equal(cov, cov.T)
+
     def test_calculate_correlation_matrix(self):
         """Test correlation matrix calculation."""
         corr_matrix = calculate_correlation_matrix(self.returns)
@@ -134,6 +190,60 @@ class TestUtils(unittest.TestCase):
         self.assertTrue((corr_matrix >= -1).all().all())
         self.assertTrue((corr_matrix <= 1).all().all())
 
+    def test_calculate_return_statistics(self):
+        """Test return statistics match the pandas-based calculation."""
+        expected_returns, cov_matrix = calculate_return_statistics(self.prices)
+
+        pd.testing.assert_series_equal(expected_returns, self.returns.mean() * 252)
+        pd.testing.assert_frame_equal(cov_matrix, self.returns.cov() * 252)
+
+    def test_calculate_return_statistics_log(self):
+        """Test log-return statistics match the pandas-based calculation."""
+        log_returns = calculate_returns(self.prices, method='log')
+        expected_returns, cov_matrix = calculate_return_statistics(self.prices, method='log')
+
+        np.testing.assert_allclose(expected_returns, log_returns.mean() * 252)
+        np.testing.assert_allclose(cov_matrix, log_returns.cov() * 252)
+
+        with self.assertRaises(ValueError):
+            calculate_return_statistics(self.prices, method='invalid')
+
+    def test_calculate_return_statistics_float32(self):
+        """Test float32 working precision returns float64 close to float64 results."""
+        expected_returns, cov_matrix = calculate_return_statistics(self.prices, dtype=np.float32)
+
+        self.assertEqual(expected_returns.dtype, np.float64)
+        self.assertEqual(cov_matrix.values.dtype, np.float64)
+        np.testing.assert_allclose(expected_returns, self.returns.mean() * 252, rtol=1e-3, atol=1e-5)
+        np.testing.assert_allclose(cov_matrix, self.returns.cov() * 252, rtol=1e-3, atol=1e-6)
+
+    def test_rolling_cov_expanding(self):
+        """Test online covariance over all observations."""
+        rolling = RollingCov()
+        for row in self.returns.values:
+            rolling.push(row)
+
+        np.testing.assert_allclose(rolling.cov(), self.returns.cov().values)
+
+    def test_rolling_cov_window(self):
+        """Test online covariance over a sliding window."""
+        rolling = RollingCov(window=20)
+        for row in self.returns.values:
+            rolling.push(row)
+
+        self.assertEqual(rolling.n, 20)
+        np.testing.assert_allclose(rolling.cov(), self.returns.iloc[-20:].cov().values)
+
+    def test_rolling_cov_reused_buffer(self):
+        """Test that pushing one reused buffer keeps each observation."""
+        rolling = RollingCov(window=20)
+        buf = np.empty(self.returns.shape[1])
+        for row in self.returns.values:
+            buf[:] = row
+            rolling.push(buf)
+
+        np.testing.assert_allclose(rolling.cov(), self.returns.iloc[-20:].cov().values)
+
 
 if __name__ == '__main__':
     unittest.main()